@@ -0,0 +1,33 @@
+"""add_ai_messages_conversation_id_created_at_index
+
+Revision ID: 89dc7dba9a97
+Revises: b7e2f9a3c1d5
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '89dc7dba9a97'
+down_revision: Union[str, None] = 'b7e2f9a3c1d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index on (conversation_id, created_at) so AIConversation.messages
+    # (ordered by created_at) is served by an index scan instead of a sort
+    op.create_index(
+        'ix_ai_messages_conversation_id_created_at',
+        'ai_messages',
+        ['conversation_id', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_messages_conversation_id_created_at', table_name='ai_messages')
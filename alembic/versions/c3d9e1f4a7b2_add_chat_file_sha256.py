@@ -0,0 +1,35 @@
+"""add_chat_file_sha256
+
+Revision ID: c3d9e1f4a7b2
+Revises: 89dc7dba9a97
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9e1f4a7b2'
+down_revision: Union[str, None] = '89dc7dba9a97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SHA-256 of the uploaded file so re-uploads of the same export return the
+    # existing chat instead of being parsed and indexed again
+    op.add_column('chats', sa.Column('file_sha256', sa.String(length=64), nullable=True))
+    op.create_index(
+        'ix_chats_user_id_file_sha256',
+        'chats',
+        ['user_id', 'file_sha256'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chats_user_id_file_sha256', table_name='chats')
+    op.drop_column('chats', 'file_sha256')
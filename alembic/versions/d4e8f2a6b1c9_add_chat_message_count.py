@@ -0,0 +1,42 @@
+"""add_chat_message_count
+
+Revision ID: d4e8f2a6b1c9
+Revises: c3d9e1f4a7b2
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8f2a6b1c9'
+down_revision: Union[str, None] = 'c3d9e1f4a7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Denormalized message count, set once when the chat is ingested
+    op.add_column(
+        'chats',
+        sa.Column('message_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    # Backfill existing chats
+    op.execute("""
+        UPDATE chats
+        SET message_count = counts.n
+        FROM (
+            SELECT chat_id, COUNT(*) AS n
+            FROM messages
+            GROUP BY chat_id
+        ) AS counts
+        WHERE counts.chat_id = chats.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('chats', 'message_count')
@@ -0,0 +1,34 @@
+"""add_chats_user_id_active_index
+
+Revision ID: e5f9a3b7c2d8
+Revises: d4e8f2a6b1c9
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f9a3b7c2d8'
+down_revision: Union[str, None] = 'd4e8f2a6b1c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial index covering only the chats a user can see (not deleted,
+    # finished processing), so listing them is an index seek on user_id
+    op.create_index(
+        'ix_chats_user_id_active',
+        'chats',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false AND status = 'completed'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chats_user_id_active', table_name='chats')
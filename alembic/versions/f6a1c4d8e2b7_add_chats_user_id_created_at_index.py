@@ -0,0 +1,32 @@
+"""add_chats_user_id_created_at_index
+
+Revision ID: f6a1c4d8e2b7
+Revises: e5f9a3b7c2d8
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a1c4d8e2b7'
+down_revision: Union[str, None] = 'e5f9a3b7c2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The chat list is paginated newest first; with created_at after user_id
+    # a page is read straight off the index (scanned backwards), no sort
+    op.create_index(
+        'ix_chats_user_id_created_at',
+        'chats',
+        ['user_id', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chats_user_id_created_at', table_name='chats')
@@ -15,6 +15,7 @@ celery_app = Celery(
     include=[
         "src.rag.tasks",  # Import task modules
         "src.vector.tasks",  # Vector indexing tasks
+        "src.chats.tasks",  # Chat cleanup tasks
     ]
 )
 
@@ -0,0 +1,60 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ..database import get_async_db
+from ..auth.dependencies import get_current_user_id
+from ..error_handlers import NotFoundException, ForbiddenException
+from ..logging_config import get_logger
+from . import models
+
+logger = get_logger(__name__)
+
+
+async def get_owned_chat(
+    chat_id: UUID,
+    user_id: Annotated[str, Depends(get_current_user_id)],
+    db: AsyncSession = Depends(get_async_db)
+) -> models.Chat:
+    """
+    Load a chat (with its category) and verify the current user owns it
+
+    Shares the request's cached user_id and db session with the endpoint.
+
+    Raises:
+        NotFoundException: 404 if the chat does not exist
+        ForbiddenException: 403 if the chat belongs to another user
+    """
+
+    result = await db.execute(
+        select(models.Chat)
+        .where(models.Chat.id == chat_id)
+        .options(joinedload(models.Chat.category))
+    )
+    chat = result.scalar_one_or_none()
+
+    if not chat:
+        logger.warning(
+            f"Chat not found: {chat_id}",
+            extra={"user_id": user_id}
+        )
+        raise NotFoundException("Chat", str(chat_id))
+
+    if chat.user_id != user_id:
+        logger.warning(
+            f"Unauthorized access attempt to chat: {chat_id}",
+            extra={
+                "user_id": user_id,
+                "extra_data": {
+                    "chat_id": str(chat_id),
+                    "chat_owner": chat.user_id
+                }
+            }
+        )
+        raise ForbiddenException("Not authorized to access this chat")
+
+    return chat
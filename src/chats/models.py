@@ -1,18 +1,31 @@
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Text, Integer, Boolean, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Text, Integer, Boolean, JSON, Index, exists, text
+from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from ..database import Base
 from ..encryption import EncryptedText, EncryptedJSON
+from ..rag.models import Insight
 import uuid
 
 class Chat(Base):
     __tablename__ = "chats"
+    __table_args__ = (
+        # Lookup for duplicate uploads (see service.get_chat_by_upload_hash)
+        Index('ix_chats_user_id_file_sha256', 'user_id', 'file_sha256'),
+        # Newest-first chat listing (see router.list_user_chats)
+        Index('ix_chats_user_id_created_at', 'user_id', 'created_at'),
+        # Partial index for the user's visible chats (see service.get_user_chats)
+        Index(
+            'ix_chats_user_id_active',
+            'user_id',
+            postgresql_where=text("is_deleted = false AND status = 'completed'")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     title = Column(EncryptedText, nullable=True)  # E.g., The name of the chat group
-    participants = Column(EncryptedText, nullable=True)  # JSON string of participant names
+    participants = Column(EncryptedJSON, nullable=True)  # List of participant names
     chat_metadata = Column(EncryptedJSON, nullable=True)  # All pre-computed stats
     partner_name = Column(EncryptedText, nullable=True)  # Extracted partner name
     user_display_name = Column(EncryptedText, nullable=True)  # User's selected display name
@@ -20,8 +33,10 @@ class Chat(Base):
     status = Column(String, default="processing")  # 'processing', 'completed', 'failed'
     error_log = Column(Text, nullable=True)  # Store parsing errors for debugging
     platform = Column(String, default="whatsapp", nullable=False)  # whatsapp, instagram, telegram
+    file_sha256 = Column(String(64), nullable=True)  # Hash of the uploaded file, to dedup re-uploads
     is_group_chat = Column(Boolean, default=False, nullable=False)
     participant_count = Column(Integer, nullable=True)
+    message_count = Column(Integer, default=0, nullable=False, server_default='0')  # Set once at ingestion
     
     # Vector-related fields
     vector_status = Column(String, default="pending")  # 'pending', 'indexing', 'completed', 'failed'
@@ -49,17 +64,35 @@ class Chat(Base):
     total_insights_completed = Column(Integer, default=0)
     total_insights_failed = Column(Integer, default=0)
 
-    messages = relationship("Message", back_populates="chat", cascade="all, delete-orphan")
-    insights = relationship("Insight", back_populates="chat", cascade="all, delete-orphan")
-    ai_conversations = relationship("AIConversation", back_populates="chat", cascade="all, delete-orphan")
-    chunks = relationship("MessageChunk", back_populates="chat", cascade="all, delete-orphan")
+    # EXISTS subquery loaded with the row (index-only via idx_chat_insight_type)
+    # instead of loading the whole insights collection just to test emptiness
+    insights_unlocked = column_property(
+        exists().where(Insight.chat_id == id)
+    )
+
+    # Never loaded through the ORM: a chat can hold 100k+ messages. Reads go through
+    # explicit queries (stream_chat_messages, message_count); deletes are left to
+    # the ON DELETE CASCADE foreign key
+    messages = relationship(
+        "Message",
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True
+    )
+    insights = relationship("Insight", back_populates="chat", cascade="all, delete-orphan", passive_deletes=True)
+    ai_conversations = relationship("AIConversation", back_populates="chat", cascade="all, delete-orphan", passive_deletes=True)
+    chunks = relationship("MessageChunk", back_populates="chat", cascade="all, delete-orphan", passive_deletes=True)
     owner = relationship("User", back_populates="chats")
     category = relationship("AnalysisCategory", back_populates="chats")
-    insights = relationship("Insight", back_populates="chat", cascade="all, delete-orphan")
 
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Created by migration 4c5d6e7f8g9h; serves every per-chat message scan
+        Index('ix_messages_chat_id_timestamp', 'chat_id', 'timestamp'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     chat_id = Column(UUID(as_uuid=True), ForeignKey("chats.id", ondelete="CASCADE"), nullable=False)
@@ -11,87 +11,58 @@ Endpoints:
 """
 
 import asyncio
-from pathlib import Path
-from typing import Annotated, List, Optional
+from typing import Annotated, BinaryIO, List, Optional, Tuple
 from uuid import UUID
-from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Form, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from ..database import get_async_db, SessionLocal
 from ..config import settings
 from ..auth.dependencies import get_current_user_id
 from ..logging_config import get_logger, log_business_event
 from ..error_handlers import (
+    AppException,
     NotFoundException,
     ForbiddenException,
     FileProcessingException,
     DatabaseException,
     ErrorCode
 )
-from ..monitoring import track_operation
 from . import schemas, service, models
-from ..rag.models import Insight
+from .dependencies import get_owned_chat
 from ..rate_limit import limiter, UPLOAD_LIMIT, CHAT_READ_LIMIT
 
 logger = get_logger(__name__)
 
-# Configure a directory to temporarily store uploaded files
-UPLOAD_FOLDER = Path("uploads")
-if not UPLOAD_FOLDER.exists():
-    UPLOAD_FOLDER.mkdir()
-
-router = APIRouter(prefix="/chats", tags=["chats"])
-
-# Thread pool for CPU-intensive file operations
-file_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file_io_")
-
-
-async def save_file_async(file_path: Path, file_content: bytes) -> None:
-    """Save file to disk in thread pool (non-blocking)"""
-    loop = asyncio.get_event_loop()
-
-    def save_to_disk():
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
-
-    await loop.run_in_executor(file_executor, save_to_disk)
+ALLOWED_CONTENT_TYPES = frozenset({"text/plain", "application/zip"})
+ZIP_MAGIC = b"PK\x03\x04"
 
+# Bound accepted-but-unfinished uploads so MAX_CONCURRENT_UPLOADS x parsed chat
+# (and spooled upload file) fits in RAM. Taken when an upload is accepted and
+# released when its background parse ends; uploads beyond it get a 503
+UPLOAD_SEM = asyncio.Semaphore(settings.MAX_CONCURRENT_UPLOADS)
 
-async def delete_file_async(file_path: Path) -> None:
-    """Delete file from disk in thread pool (non-blocking)"""
-    loop = asyncio.get_event_loop()
-
-    def delete_from_disk():
-        if file_path.exists():
-            file_path.unlink()
-
-    await loop.run_in_executor(file_executor, delete_from_disk)
+router = APIRouter(prefix="/chats", tags=["chats"])
 
 
-def _process_whatsapp_file_sync(chat_id: UUID, file_path: str):
+def _process_whatsapp_file_sync(chat_id: UUID, source: BinaryIO, filename: str, is_zip: bool) -> dict:
     """
     Wrapper for CPU-intensive WhatsApp file processing.
-    Creates its own sync database session.
+    Creates its own sync database session and returns the chat's stats.
     """
     db = SessionLocal()
     try:
-        return service.process_whatsapp_file(chat_id, file_path, db)
-    finally:
-        db.close()
-
-
-def _delete_chat_background(chat_id: str):
-    """
-    Background task wrapper for deleting a chat.
-    Creates its own sync database session.
-    """
-    db = SessionLocal()
-    try:
-        service._delete_chat_sync(db, chat_id)
+        chat = service.process_whatsapp_file(chat_id, source, filename, is_zip, db)
+        # Read while the session is open: the final commit expired the instance
+        return {
+            "message_count": chat.message_count,
+            "participant_count": chat.participant_count,
+            "is_group_chat": chat.is_group_chat
+        }
     finally:
         db.close()
 
@@ -107,10 +78,24 @@ async def upload_whatsapp_file(
     response: Response,  # Required for slowapi to inject rate limit headers
     file: Annotated[UploadFile, File(...)],
     user_id: Annotated[str, Depends(get_current_user_id)],
+    background_tasks: BackgroundTasks,
     category_id: Optional[str] = Form(None),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """Upload and process WhatsApp chat file asynchronously with thread-based file I/O"""
+    """
+    Upload a WhatsApp chat file for processing
+
+    Status-polling contract:
+    - 202: the upload was accepted and the chat is returned with status
+      'processing'. Parsing runs after the response; poll GET /chats/{chat_id}
+      until status is 'completed' (chat_metadata filled in) or 'failed'
+      (error_log says why). Failed chats stay listed until deleted.
+    - 200: the same file was already uploaded under this category, and that
+      chat is returned as-is. It may still be 'processing' if the first upload
+      has not finished; poll it the same way.
+    - 400: the file was rejected before acceptance (type, size, zip).
+    - 503: MAX_CONCURRENT_UPLOADS uploads are already being processed; retry later.
+    """
     
     logger.info(
         "Chat upload initiated",
@@ -126,8 +111,7 @@ async def upload_whatsapp_file(
     )
     
     # 1. File Validation
-    allowed_types = ["text/plain", "application/zip"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_CONTENT_TYPES:
         logger.warning(
             f"Invalid file type rejected: {file.content_type}",
             extra={
@@ -135,7 +119,7 @@ async def upload_whatsapp_file(
                 "extra_data": {
                     "filename": file.filename,
                     "content_type": file.content_type,
-                    "allowed_types": allowed_types
+                    "allowed_types": sorted(ALLOWED_CONTENT_TYPES)
                 }
             }
         )
@@ -162,142 +146,210 @@ async def upload_whatsapp_file(
             error_code=ErrorCode.FILE_TOO_LARGE
         )
 
-    # 2. Save the file to a temporary location (in thread pool)
-    file_path = None
-    try:
-        file_path = UPLOAD_FOLDER / file.filename
-        file_content = await file.read()  # Read file content asynchronously
-
-        with track_operation("save_uploaded_file", filename=file.filename):
-            # Run file I/O in thread pool to not block event loop
-            await save_file_async(file_path, file_content)
-
-        logger.debug(
-            f"File saved to temporary location: {file_path}",
-            extra={"user_id": user_id, "extra_data": {"file_path": str(file_path)}}
+    # Content-Type is client-controlled: sniff the content itself and use
+    # that to pick the zip or text reader
+    head = await file.read(len(ZIP_MAGIC))
+    await file.seek(0)
+    is_zip = head.startswith(ZIP_MAGIC)
+    if file.content_type == "application/zip" and not is_zip:
+        logger.warning(
+            "Upload labelled as zip is not a zip archive",
+            extra={
+                "user_id": user_id,
+                "extra_data": {"filename": file.filename}
+            }
+        )
+        raise FileProcessingException(
+            "Invalid zip file format",
+            error_code=ErrorCode.INVALID_FILE_FORMAT
         )
 
-    except Exception as e:
-        logger.error(
-            f"Failed to save uploaded file: {e}",
+    # 2. Backpressure: take an upload slot before accepting; the background
+    # parse releases it. Rejecting here (rather than queueing) stops spooled
+    # uploads from piling up behind the parses
+    if UPLOAD_SEM.locked():
+        logger.warning(
+            "Upload rejected: too many uploads in progress",
             extra={
                 "user_id": user_id,
                 "extra_data": {
                     "filename": file.filename,
-                    "error_type": type(e).__name__
+                    "max_concurrent_uploads": settings.MAX_CONCURRENT_UPLOADS
                 }
-            },
-            exc_info=True
+            }
+        )
+        raise AppException(
+            message="Too many uploads are being processed. Please retry shortly.",
+            error_code=ErrorCode.RATE_LIMIT_EXCEEDED,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
         )
-        raise FileProcessingException(f"Failed to save file: {str(e)}")
+    await UPLOAD_SEM.acquire()  # Not locked, so this returns without waiting
 
+    parse_queued = False
     try:
-        # 3. Create a chat entry in the database with 'processing' status
-        # Note: service.create_chat is now async, call directly
-        db_chat = await service.create_chat(
-            db,
-            user_id,
-            file.filename,
-            category_id
+        chat_response, parse_queued = await _accept_upload(
+            file, user_id, background_tasks, category_id, is_zip, db
         )
+    finally:
+        if not parse_queued:
+            UPLOAD_SEM.release()  # Otherwise the background parse releases it
+
+    if parse_queued:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return chat_response
+
+
+async def _accept_upload(
+    file: UploadFile,
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    category_id: Optional[str],
+    is_zip: bool,
+    db: AsyncSession
+) -> Tuple[schemas.ChatUploadResponse, bool]:
+    """
+    Dedup and create the chat for a validated upload, then queue its parse
 
+    Returns (chat, parse_queued). Called holding an UPLOAD_SEM slot, which
+    belongs to the queued background parse when parse_queued is True.
+    """
+
+    # Short-circuit re-uploads of the same file and category (e.g. client retries)
+    loop = asyncio.get_event_loop()
+    file_sha256 = await loop.run_in_executor(
+        None,
+        service.compute_upload_sha256,
+        file.file
+    )
+    existing_chat = await service.get_chat_by_upload_hash(db, user_id, file_sha256, category_id)
+    if existing_chat:
         logger.info(
-            f"Chat record created with ID: {db_chat.id}",
+            f"Duplicate upload, returning existing chat: {existing_chat.id}",
             extra={
                 "user_id": user_id,
                 "extra_data": {
-                    "chat_id": str(db_chat.id),
-                    "status": db_chat.status
+                    "chat_id": str(existing_chat.id),
+                    "filename": file.filename
                 }
             }
         )
+        return schemas.ChatUploadResponse.from_orm(existing_chat), False
+
+    # Create a chat entry in the database with 'processing' status
+    db_chat = await service.create_chat(
+        db,
+        user_id,
+        file.filename,
+        category_id,
+        file_sha256=file_sha256
+    )
 
-        # 4. Process the file asynchronously (CPU-intensive parsing in thread pool)
-        # This creates its own sync session internally
-        loop = asyncio.get_event_loop()
-        processed_chat = await loop.run_in_executor(
-            None,
-            _process_whatsapp_file_sync,
-            db_chat.id,
-            str(file_path)
-        )
-        
-        # 5. Log successful processing as business event
-        log_business_event(
-            event_type="chat_uploaded",
-            user_id=user_id,
-            chat_id=str(processed_chat.id),
-            filename=file.filename,
-            file_size_bytes=file.size,
-            message_count=processed_chat.chat_metadata.get("total_messages", 0) if processed_chat.chat_metadata else 0,
-            participant_count=processed_chat.participant_count,
-            is_group_chat=processed_chat.is_group_chat
-        )
-        
-        logger.info(
-            f"Chat processed successfully: {processed_chat.id}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {
-                    "chat_id": str(processed_chat.id),
-                    "message_count": processed_chat.chat_metadata.get("total_messages", 0) if processed_chat.chat_metadata else 0,
-                    "participant_count": processed_chat.participant_count
-                }
+    logger.info(
+        f"Chat record created with ID: {db_chat.id}",
+        extra={
+            "user_id": user_id,
+            "extra_data": {
+                "chat_id": str(db_chat.id),
+                "status": db_chat.status
             }
-        )
+        }
+    )
 
-        # 6. Return the completed chat with all metadata
-        return schemas.ChatUploadResponse.from_orm(processed_chat)
-         
-    except FileProcessingException:
-        # Re-raise our custom exceptions (already logged in service)
-        raise
+    chat_response = schemas.ChatUploadResponse.from_orm(db_chat)
 
-    except Exception as e:
-        logger.error(
-            f"Unexpected error during chat processing: {e}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {
-                    "filename": file.filename,
-                    "chat_id": str(db_chat.id) if 'db_chat' in locals() else None,
-                    "error_type": type(e).__name__
-                }
-            },
-            exc_info=True
-        )
+    # Parse after the response is sent; the client polls GET /chats/{chat_id}
+    # until status is 'completed' or 'failed'
+    background_tasks.add_task(
+        _process_upload_in_background,
+        db_chat.id,
+        file,
+        is_zip,
+        user_id
+    )
 
-        # Clean up the chat if it was created
-        if 'db_chat' in locals():
-            try:
-                await service.delete_chat(db, db_chat.id)
-                logger.info(
-                    f"Cleaned up failed chat: {db_chat.id}",
-                    extra={"user_id": user_id}
-                )
-            except Exception as cleanup_error:
-                logger.error(
-                    f"Failed to cleanup chat after error: {cleanup_error}",
-                    extra={"user_id": user_id},
-                    exc_info=True
-                )
+    return chat_response, True
 
-        raise FileProcessingException(f"Failed to process file: {str(e)}")
 
+async def _process_upload_in_background(
+    chat_id: UUID,
+    file: UploadFile,
+    is_zip: bool,
+    user_id: str
+):
+    """
+    Parse an accepted upload and store its messages (runs as a background task)
+
+    The UploadFile stays open until background tasks finish, so it is parsed
+    in place. Failures are recorded on the chat (status 'failed', error_log)
+    by the service rather than raised to a client. Releases the UPLOAD_SEM
+    slot the upload endpoint took.
+    """
+
+    try:
+        loop = asyncio.get_event_loop()
+        try:
+            # CPU-intensive parsing in thread pool, with its own sync session
+            chat_stats = await loop.run_in_executor(
+                None,
+                _process_whatsapp_file_sync,
+                chat_id,
+                file.file,
+                file.filename,
+                is_zip
+            )
+        except FileProcessingException as e:
+            logger.warning(
+                f"Background chat processing failed: {chat_id}",
+                extra={
+                    "user_id": user_id,
+                    "extra_data": {
+                        "chat_id": str(chat_id),
+                        "filename": file.filename,
+                        "error": e.message
+                    }
+                }
+            )
+            return
+        except Exception as e:
+            logger.error(
+                f"Unexpected error during chat processing: {e}",
+                extra={
+                    "user_id": user_id,
+                    "extra_data": {
+                        "chat_id": str(chat_id),
+                        "filename": file.filename,
+                        "error_type": type(e).__name__
+                    }
+                },
+                exc_info=True
+            )
+            return
     finally:
-        # 7. Clean up the temporary file asynchronously
-        if file_path:
-            try:
-                await delete_file_async(file_path)
-                logger.debug(
-                    f"Temporary file deleted: {file_path}",
-                    extra={"user_id": user_id}
-                )
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to clean up temp file {file_path}: {cleanup_error}",
-                    extra={"user_id": user_id}
-                )
+        UPLOAD_SEM.release()
+
+    # Log successful processing as business event
+    log_business_event(
+        event_type="chat_uploaded",
+        user_id=user_id,
+        chat_id=str(chat_id),
+        filename=file.filename,
+        file_size_bytes=file.size,
+        message_count=chat_stats["message_count"],
+        participant_count=chat_stats["participant_count"],
+        is_group_chat=chat_stats["is_group_chat"]
+    )
+
+    logger.info(
+        f"Chat processed successfully: {chat_id}",
+        extra={
+            "user_id": user_id,
+            "extra_data": {
+                "chat_id": str(chat_id),
+                "message_count": chat_stats["message_count"],
+                "participant_count": chat_stats["participant_count"]
+            }
+        }
+    )
 
 
 # ============================================================================
@@ -307,9 +359,15 @@ async def upload_whatsapp_file(
 @router.get("", response_model=List[schemas.GetChatResponse])
 async def list_user_chats(
     user_id: Annotated[str, Depends(get_current_user_id)],
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all chats for the current user"""
+    """
+    Get the current user's chats, newest first
+
+    Returns every chat unless limit is given; limit/offset page through them.
+    """
 
     logger.debug(
         "Fetching user chats",
@@ -318,14 +376,15 @@ async def list_user_chats(
 
     try:
         # Use async query to fetch chats directly with eager loading
-        result = await db.execute(
-            select(models.Chat)
-            .where(models.Chat.user_id == user_id)
-            .options(
-                selectinload(models.Chat.category),
-                selectinload(models.Chat.insights).selectinload(Insight.insight_type)
-            )
-        )
+        # (ordered by the (user_id, created_at) index, so no sort of all chats)
+        stmt = select(models.Chat)\
+            .where(models.Chat.user_id == user_id)\
+            .options(joinedload(models.Chat.category))\
+            .order_by(models.Chat.created_at.desc())\
+            .offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await db.execute(stmt)
         chats = result.scalars().all()
         
         # Convert DB chat objects to schema using the classmethod
@@ -380,84 +439,34 @@ async def list_user_chats(
 
 @router.get("/{chat_id}", response_model=schemas.GetChatResponse)
 async def get_chat_details(
-    chat_id: UUID,
-    user_id: Annotated[str, Depends(get_current_user_id)],
-    db: AsyncSession = Depends(get_async_db)
+    chat: Annotated[models.Chat, Depends(get_owned_chat)],
+    user_id: Annotated[str, Depends(get_current_user_id)]
 ):
     """Get detailed information about a specific chat"""
 
     logger.debug(
-        "Fetching chat details",
-        extra={
-            "user_id": user_id,
-            "extra_data": {"chat_id": str(chat_id)}
-        }
+        f"Chat details retrieved: {chat.id}",
+        extra={"user_id": user_id}
     )
 
-    try:
-        # Use async query to fetch chat with eager loading to prevent lazy loading in async context
-        result = await db.execute(
-            select(models.Chat)
-            .where(models.Chat.id == chat_id)
-            .options(
-                selectinload(models.Chat.category),
-                selectinload(models.Chat.insights).selectinload(Insight.insight_type)
-            )
-        )
-        chat = result.scalar_one_or_none()
-        
-        if not chat:
-            logger.warning(
-                f"Chat not found: {chat_id}",
-                extra={"user_id": user_id}
-            )
-            raise NotFoundException("Chat", str(chat_id))
-        
-        if chat.user_id != user_id:
-            logger.warning(
-                f"Unauthorized access attempt to chat: {chat_id}",
-                extra={
-                    "user_id": user_id,
-                    "extra_data": {
-                        "chat_id": str(chat_id),
-                        "chat_owner": chat.user_id
-                    }
-                }
-            )
-            raise ForbiddenException("Not authorized to access this chat")
-        
-        logger.debug(
-            f"Chat details retrieved: {chat_id}",
-            extra={"user_id": user_id}
-        )
-        
-        return schemas.GetChatResponse.from_orm(chat)
-    
-    except (NotFoundException, ForbiddenException):
-        raise
-    except Exception as e:
-        logger.error(
-            f"Failed to get chat details: {e}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {"chat_id": str(chat_id)}
-            },
-            exc_info=True
-        )
-        raise DatabaseException("Failed to retrieve chat", original_error=e)
+    return schemas.GetChatResponse.from_orm(chat)
 
 
 # ============================================================================
 # GET CHAT MESSAGES
 # ============================================================================
 
-@router.get("/{chat_id}/messages", response_model=List[schemas.ChatMessagesResponse])
+@router.get(
+    "/{chat_id}/messages",
+    response_model=List[schemas.ChatMessagesResponse],
+    operation_id="list_chat_messages"
+)
 async def get_chat_messages(
     chat_id: UUID,
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all messages for a chat"""
+    """Get all messages for a chat (streamed, ordered by timestamp)"""
 
     logger.debug(
         "Fetching chat messages",
@@ -467,42 +476,19 @@ async def get_chat_messages(
         }
     )
 
-    try:
-        # Get chat messages (async service call)
-        messages = await service.get_chat_messages(db, chat_id, user_id)
-        
-        logger.info(
-            f"Retrieved {len(messages)} messages",
-            extra={
-                "user_id": user_id,
-                "extra_data": {
-                    "chat_id": str(chat_id),
-                    "message_count": len(messages)
-                }
-            }
-        )
-        
-        return messages
-    
-    except HTTPException as e:
-        # get_chat_messages raises HTTPException for forbidden access
-        if e.status_code == 403:
-            logger.warning(
-                f"Unauthorized access to chat messages: {chat_id}",
-                extra={"user_id": user_id}
-            )
-            raise ForbiddenException("You do not have access to this chat")
-        raise
-    except Exception as e:
-        logger.error(
-            f"Failed to retrieve messages: {e}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {"chat_id": str(chat_id)}
-            },
-            exc_info=True
+    # Check ownership up front: once streaming starts the status code is sent
+    if not await service.user_owns_chat(db, chat_id, user_id):
+        logger.warning(
+            f"Unauthorized access to chat messages: {chat_id}",
+            extra={"user_id": user_id}
         )
-        raise DatabaseException("Failed to retrieve messages", original_error=e)
+        raise ForbiddenException("You do not have access to this chat")
+
+    # Stream the JSON array batch by batch instead of building the full list
+    return StreamingResponse(
+        service.stream_chat_messages(chat_id),
+        media_type="application/json"
+    )
 
 
 # ============================================================================
@@ -511,74 +497,31 @@ async def get_chat_messages(
 
 @router.get("/{chat_id}/vector-status", response_model=schemas.VectorStatusResponse)
 async def get_chat_vector_status(
-    chat_id: str,
-    user_id: Annotated[str, Depends(get_current_user_id)],
-    db: AsyncSession = Depends(get_async_db)
+    chat: Annotated[models.Chat, Depends(get_owned_chat)],
+    user_id: Annotated[str, Depends(get_current_user_id)]
 ):
     """Get vector indexing status for a chat"""
 
+    vector_status = getattr(chat, 'vector_status', 'pending')
+
     logger.debug(
-        "Checking vector status",
+        f"Vector status: {vector_status}",
         extra={
             "user_id": user_id,
-            "extra_data": {"chat_id": chat_id}
+            "extra_data": {
+                "chat_id": str(chat.id),
+                "vector_status": vector_status
+            }
         }
     )
 
-    try:
-        # Use async query to fetch chat
-        result = await db.execute(
-            select(models.Chat).where(models.Chat.id == chat_id)
-        )
-        chat = result.scalar_one_or_none()
-        
-        if not chat:
-            logger.warning(
-                f"Chat not found for vector status check: {chat_id}",
-                extra={"user_id": user_id}
-            )
-            raise NotFoundException("Chat", chat_id)
-        
-        if chat.user_id != user_id:
-            logger.warning(
-                f"Unauthorized vector status check: {chat_id}",
-                extra={"user_id": user_id}
-            )
-            raise ForbiddenException("Not authorized to access this chat")
-        
-        vector_status = getattr(chat, 'vector_status', 'pending')
-        
-        logger.debug(
-            f"Vector status: {vector_status}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {
-                    "chat_id": chat_id,
-                    "vector_status": vector_status
-                }
-            }
-        )
-        
-        return schemas.VectorStatusResponse(
-            chat_id=chat.id,
-            vector_status=vector_status,
-            chunk_count=getattr(chat, 'chunk_count', 0),
-            indexed_at=getattr(chat, 'indexed_at', None),
-            is_searchable=vector_status == 'completed'
-        )
-    
-    except (NotFoundException, ForbiddenException):
-        raise
-    except Exception as e:
-        logger.error(
-            f"Failed to check vector status: {e}",
-            extra={
-                "user_id": user_id,
-                "extra_data": {"chat_id": chat_id}
-            },
-            exc_info=True
-        )
-        raise DatabaseException("Failed to check vector status", original_error=e)
+    return schemas.VectorStatusResponse(
+        chat_id=chat.id,
+        vector_status=vector_status,
+        chunk_count=getattr(chat, 'chunk_count', 0),
+        indexed_at=getattr(chat, 'indexed_at', None),
+        is_searchable=vector_status == 'completed'
+    )
 
 
 # ============================================================================
@@ -587,15 +530,16 @@ async def get_chat_vector_status(
 
 @router.delete("/{chat_id}", response_model=schemas.ChatDeleteResponse)
 async def soft_delete_chat(
-    chat_id: UUID,
+    chat: Annotated[models.Chat, Depends(get_owned_chat)],
     user_id: Annotated[str, Depends(get_current_user_id)],
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_async_db)
 ):
     """
     Soft delete chat and schedule permanent cleanup
     """
 
+    chat_id = chat.id
+
     logger.info(
         "Chat deletion requested",
         extra={
@@ -605,32 +549,6 @@ async def soft_delete_chat(
     )
 
     try:
-        # Check if chat exists using async query
-        result = await db.execute(
-            select(models.Chat).where(models.Chat.id == chat_id)
-        )
-        chat = result.scalar_one_or_none()
-        if not chat:
-            logger.warning(
-                f"Delete attempt on non-existent chat: {chat_id}",
-                extra={"user_id": user_id}
-            )
-            raise NotFoundException("Chat", str(chat_id))
-        
-        # Verify ownership
-        if chat.user_id != user_id:
-            logger.warning(
-                f"Unauthorized delete attempt: {chat_id}",
-                extra={
-                    "user_id": user_id,
-                    "extra_data": {
-                        "chat_id": str(chat_id),
-                        "chat_owner": chat.user_id
-                    }
-                }
-            )
-            raise ForbiddenException("Not authorized to delete this chat")
-        
         # Soft delete chat and related data
         deleted_chat = await service.soft_delete_chat(db, chat.id)
         if not deleted_chat:
@@ -640,15 +558,16 @@ async def soft_delete_chat(
             )
             raise DatabaseException("Failed to delete chat")
 
-        # Schedule permanent cleanup in background
-        background_tasks.add_task(_delete_chat_background, chat.id)
+        # Queue permanent cleanup on the worker pool (own session, survives restarts)
+        from .tasks import delete_chat as delete_chat_task
+        delete_chat_task.delay(str(chat.id))
         
         # Log business event
         log_business_event(
             event_type="chat_deleted",
             user_id=user_id,
             chat_id=str(chat_id),
-            message_count=chat.chat_metadata.get("total_messages", 0) if chat.chat_metadata else 0
+            message_count=chat.message_count
         )
         
         logger.info(
@@ -1,10 +1,10 @@
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional, List
-import json
 from uuid import UUID
 
-class ChatUploadResponse(BaseModel):
+class ChatResponseBase(BaseModel):
+    """Fields shared by every chat response"""
     chat_id: UUID
     user_id: str
     title: Optional[str] = None
@@ -13,10 +13,11 @@ class ChatUploadResponse(BaseModel):
     user_display_name: Optional[str] = None
     chat_metadata: Optional[dict] = None  # Raw JSON with all stats
     category_id: Optional[UUID] = None
-    category_slug: Optional[str] = None  # ADD THIS
-    category_name: Optional[str] = None  # ADD THIS
+    category_slug: Optional[str] = None
+    category_name: Optional[str] = None
     created_at: datetime
-    insights_unlocked: bool  # check if insights exist
+    message_count: int = 0
+    insights_unlocked: bool
     status: str
     vector_status: str = "pending"
     chunk_count: int = 0
@@ -25,121 +26,62 @@ class ChatUploadResponse(BaseModel):
 
     class Config:
         from_attributes = True
-    
+
+
+def _chat_fields(db_chat) -> dict:
+    """Read the ChatResponseBase fields (except insights_unlocked) off a Chat row"""
+    category = db_chat.category
+    return dict(
+        chat_id=db_chat.id,
+        user_id=db_chat.user_id,
+        title=db_chat.title,
+        filename=db_chat.title or "Unnamed Chat",
+        participants=db_chat.participants,
+        user_display_name=db_chat.user_display_name,
+        chat_metadata=db_chat.chat_metadata,  # Return raw JSON dict
+        category_id=db_chat.category_id,
+        category_slug=category.name if category else None,  # 'romantic', 'friendship'
+        category_name=category.display_name if category else None,  # 'Romantic'
+        created_at=db_chat.created_at,
+        message_count=db_chat.message_count or 0,
+        status=db_chat.status,
+        vector_status=getattr(db_chat, 'vector_status', 'pending'),
+        chunk_count=getattr(db_chat, 'chunk_count', 0),
+        indexed_at=getattr(db_chat, 'indexed_at', None),
+        error_log=db_chat.error_log,
+    )
+
+
+class ChatUploadResponse(ChatResponseBase):
+
     @classmethod
     def from_orm(cls, db_chat):
         """Convert database Chat object to schema"""
-        participants_list = None
-        if db_chat.participants:
-            try:
-                participants_list = json.loads(db_chat.participants)
-            except (json.JSONDecodeError, TypeError):
-                participants_list = None
-        
-        # Get category info if exists
-        category_slug = None
-        category_name = None
-        if db_chat.category:
-            category_slug = db_chat.category.name  # 'romantic', 'friendship'
-            category_name = db_chat.category.display_name  # 'Romantic'
-        
-         # Check if insights exist
-        insights_unlocked = len(db_chat.insights) > 0
-        
+        # Check if insights exist (Chat.insights_unlocked EXISTS column)
         return cls(
-            chat_id=db_chat.id,
-            user_id=db_chat.user_id,
-            title=db_chat.title,
-            filename=db_chat.title or "Unnamed Chat",
-            participants=participants_list,
-            user_display_name=db_chat.user_display_name,
-            chat_metadata=db_chat.chat_metadata,  # Return raw JSON dict
-            category_id=db_chat.category_id,
-            category_slug=category_slug,
-            category_name=category_name,
-            created_at=db_chat.created_at,
-            insights_unlocked=insights_unlocked,
-            status=db_chat.status,
-            vector_status=getattr(db_chat, 'vector_status', 'pending'),
-            chunk_count=getattr(db_chat, 'chunk_count', 0),
-            indexed_at=getattr(db_chat, 'indexed_at', None),
-            error_log=db_chat.error_log
+            **_chat_fields(db_chat),
+            insights_unlocked=db_chat.insights_unlocked,
         )
 
-class GetChatResponse(BaseModel):
-    chat_id: UUID
-    user_id: str
-    title: Optional[str] = None
-    filename: str
-    participants: Optional[List[str]] = None
-    user_display_name: Optional[str] = None
-    chat_metadata: Optional[dict] = None  # Raw JSON with all stats
-    category_id: Optional[UUID] = None
-    category_slug: Optional[str] = None
-    category_name: Optional[str] = None
-    created_at: datetime
+
+class GetChatResponse(ChatResponseBase):
     platform: str
-    status: str
-    insights_unlocked: bool  # Derived from insights_generation_status == "completed"
+    # insights_unlocked is derived from insights_generation_status == "completed"
     insights_generation_status: Optional[str] = None  # "not_started" | "queued" | "generating" | "completed" | "partial_failure" | "failed"
     insights_unlocked_at: Optional[datetime] = None
-    vector_status: str = "pending"
-    chunk_count: int = 0
-    indexed_at: Optional[datetime] = None
-    error_log: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-    
     @classmethod
     def from_orm(cls, db_chat):
         """Convert database Chat object to schema"""
-        participants_list = None
-        if db_chat.participants:
-            try:
-                participants_list = json.loads(db_chat.participants)
-            except (json.JSONDecodeError, TypeError):
-                participants_list = None
-        
-        # Get category info if exists
-        category_slug = None
-        category_name = None
-        if db_chat.category:
-            category_slug = db_chat.category.name
-            category_name = db_chat.category.display_name
-        
-        # Check if insights exist and are completed
-        # insights_unlocked = any(
-        #     insight.status == InsightStatus.COMPLETED 
-        #     for insight in db_chat.insights
-        # ) if db_chat.insights else False
-
-        # Check if insights exist
-        # insights_unlocked = len(db_chat.insights) > 0
-        
         return cls(
-            chat_id=db_chat.id,
-            user_id=db_chat.user_id,
-            title=db_chat.title,
-            filename=db_chat.title or "Unnamed Chat",
-            participants=participants_list,
-            user_display_name=db_chat.user_display_name,
-            chat_metadata=db_chat.chat_metadata,  # Return raw JSON dict
-            category_id=db_chat.category_id,
-            category_slug=category_slug,
-            category_name=category_name,
+            **_chat_fields(db_chat),
+            platform=db_chat.platform,
             insights_unlocked=db_chat.insights_generation_status == "completed",
             insights_generation_status=getattr(db_chat, 'insights_generation_status', 'not_started'),
             insights_unlocked_at=getattr(db_chat, 'insights_unlocked_at', None),
-            created_at=db_chat.created_at,
-            platform=db_chat.platform,
-            status=db_chat.status,
-            vector_status=getattr(db_chat, 'vector_status', 'pending'),
-            chunk_count=getattr(db_chat, 'chunk_count', 0),
-            indexed_at=getattr(db_chat, 'indexed_at', None),
-            error_log=db_chat.error_log
         )
-        
+
+
 class ChatMessagesResponse(BaseModel):
     id: UUID
     chat_id: UUID
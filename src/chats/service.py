@@ -1,28 +1,36 @@
+import csv
+import io
+import hashlib
+import mmap
 import os
-import json
 from uuid import UUID
 import uuid
 import zipfile
-from pathlib import Path
-from typing import Optional, Dict, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Any, AsyncIterator, BinaryIO
 from sqlalchemy.sql import func
 
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.exc import SQLAlchemyError
 import whatstk
-from fastapi import HTTPException, status
+# Private helpers (whatstk has no public parse-from-string API); safe only
+# because whatstk is pinned to the version they were checked against
+from whatstk.whatsapp.parser import _clean_text, _df_from_str
 
 import re
 from datetime import timedelta
-from collections import Counter
 import emoji
+import orjson
+import numpy as np
 import pandas as pd
 from nltk.corpus import stopwords
 import nltk
 
-from src.rag.models import AIConversation, Insight
+from src.database import async_session
+from src.encryption import EncryptedText
+from src.rag.models import AIConversation
 from src.logging_config import get_logger
 from src.error_handlers import (
     DatabaseException,
@@ -35,6 +43,9 @@ from . import models
 
 logger = get_logger(__name__)
 
+# Used to encrypt message fields on the COPY path, which skips column types
+_ENCRYPTED_TEXT = EncryptedText()
+
 # Download stopwords if not already present
 try:
     nltk.data.find('corpora/stopwords')
@@ -50,6 +61,9 @@ CONFIG = {
     'DOUBLE_TEXT_THRESHOLD': 2,
     'MAX_RESPONSE_TIME_HOURS': 4,
     'MAX_LINKS_STORED': 1000,
+    'BULK_INSERT_CHUNK': 5000,  # Messages per insert batch/commit
+    'MESSAGE_STREAM_BATCH_SIZE': 2000,
+    'MMAP_MIN_BYTES': 16 * 1024 * 1024,  # Uploads at least this big are decoded from an mmap
     'HINDI_STOPWORDS': ['hai', 'hain', 'ka', 'ki', 'ke', 'ko', 'me', 'mein', 'se', 'ne', 'par',
                         'aur', 'kya', 'toh', 'bhi', 'tha', 'thi', 'the', 'ho', 'hum', 'tu',
                         'yeh', 'woh', 'is', 'us', 'ek', 'nahi', 'kyu', 'kyun', 'kaise'],
@@ -68,7 +82,13 @@ CONFIG = {
 # CORE CRUD OPERATIONS
 # ============================================================================
 
-async def create_chat(db: AsyncSession, user_id: str, filename: str, category_id: Optional[str] = None):
+async def create_chat(
+    db: AsyncSession,
+    user_id: str,
+    filename: str,
+    category_id: Optional[str] = None,
+    file_sha256: Optional[str] = None
+):
     """Create a new chat record"""
 
     new_chat_id = str(uuid.uuid4())
@@ -91,11 +111,19 @@ async def create_chat(db: AsyncSession, user_id: str, filename: str, category_id
             user_id=user_id,
             title=filename,
             category_id=category_id if category_id else None,
+            file_sha256=file_sha256,
             status="processing"
         )
         db.add(db_chat)
         await db.commit()
-        await db.refresh(db_chat)
+        # One SELECT for everything the upload response reads that isn't set
+        # here: created_at (server default), insights_unlocked and the category
+        db_chat = await db.get(
+            models.Chat,
+            db_chat.id,
+            options=[joinedload(models.Chat.category)],
+            populate_existing=True
+        )
 
         logger.info(
             f"Chat record created: {new_chat_id}",
@@ -123,6 +151,54 @@ async def create_chat(db: AsyncSession, user_id: str, filename: str, category_id
         raise DatabaseException("Failed to create chat record", original_error=e)
 
 
+def compute_upload_sha256(source: BinaryIO) -> str:
+    """SHA-256 of an uploaded file object, leaving it rewound for parsing"""
+    source.seek(0)
+    digest = hashlib.file_digest(source, 'sha256').hexdigest()
+    source.seek(0)
+    return digest
+
+
+async def get_chat_by_upload_hash(
+    db: AsyncSession,
+    user_id: str,
+    file_sha256: str,
+    category_id: Optional[str] = None
+):
+    """
+    Find a completed or still-processing, non-deleted chat the user already
+    uploaded from the same file under the same category (insights depend on
+    the category, so a re-upload under another category is a new chat).
+    Matching in-flight chats makes a retry sent while the first upload is
+    still parsing return that chat instead of parsing the file twice; failed
+    chats are skipped so the file can be re-uploaded.
+    """
+
+    try:
+        stmt = select(models.Chat)\
+            .options(joinedload(models.Chat.category))\
+            .filter(
+                models.Chat.user_id == user_id,
+                models.Chat.file_sha256 == file_sha256,
+                models.Chat.category_id == category_id if category_id
+                else models.Chat.category_id.is_(None),
+                models.Chat.status.in_(("completed", "processing")),
+                ~models.Chat.is_deleted
+            )\
+            .order_by(models.Chat.created_at.desc())\
+            .limit(1)
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    except SQLAlchemyError as e:
+        logger.error(
+            f"Database error looking up upload hash: {e}",
+            extra={"user_id": user_id},
+            exc_info=True
+        )
+        raise DatabaseException("Failed to check for duplicate upload", original_error=e)
+
+
 def _get_chat_by_id_sync(db: Session, chat_id: UUID):
     """Sync version: Get chat by ID with all relationships loaded"""
     logger.debug(f"Fetching chat by ID (sync): {chat_id}")
@@ -130,10 +206,7 @@ def _get_chat_by_id_sync(db: Session, chat_id: UUID):
     try:
         with track_operation("get_chat_by_id", chat_id=str(chat_id)):
             stmt = select(models.Chat)\
-                .options(
-                    selectinload(models.Chat.category),
-                    selectinload(models.Chat.insights).selectinload(Insight.insight_type)
-                )\
+                .options(joinedload(models.Chat.category))\
                 .filter(models.Chat.id == chat_id)
             result = db.execute(stmt)
             chat = result.scalar_one_or_none()
@@ -145,7 +218,7 @@ def _get_chat_by_id_sync(db: Session, chat_id: UUID):
                     "extra_data": {
                         "chat_id": str(chat_id),
                         "status": chat.status,
-                        "message_count": len(chat.messages) if chat.messages else 0
+                        "message_count": chat.message_count
                     }
                 }
             )
@@ -172,8 +245,7 @@ async def get_chat_by_id(db: AsyncSession, chat_id: UUID):
         with track_operation("get_chat_by_id", chat_id=str(chat_id)):
             stmt = select(models.Chat)\
                 .options(
-                    selectinload(models.Chat.category),
-                    selectinload(models.Chat.insights).selectinload(Insight.insight_type)
+                    joinedload(models.Chat.category)
                     # selectinload(models.Chat.messages)
                 )\
                 .filter(models.Chat.id == chat_id)
@@ -217,8 +289,7 @@ async def get_user_chats(db: AsyncSession, user_id: str):
         with track_operation("get_user_chats", user_id=user_id):
             stmt = select(models.Chat)\
                 .options(
-                    selectinload(models.Chat.category),
-                    selectinload(models.Chat.insights).selectinload(Insight.insight_type),
+                    joinedload(models.Chat.category),
                     # REMOVED: selectinload(models.Chat.messages)  ← Don't load messages here
                 )\
                 .filter(
@@ -248,59 +319,19 @@ async def get_user_chats(db: AsyncSession, user_id: str):
         raise DatabaseException("Failed to fetch user chats", original_error=e)
 
 
-async def get_chat_messages(db: AsyncSession, chat_id: UUID, user_id: str):
-    """Get all messages for a chat with authorization check"""
-
-    logger.debug(
-        "Fetching chat messages",
-        extra={
-            "user_id": user_id,
-            "extra_data": {"chat_id": str(chat_id)}
-        }
-    )
-
+async def user_owns_chat(db: AsyncSession, chat_id: UUID, user_id: str) -> bool:
+    """Check that a chat exists and belongs to the user (no rows loaded)"""
     try:
-        with track_operation("get_chat_messages", chat_id=str(chat_id)):
-            stmt = select(models.Message)\
-                .join(models.Chat)\
-                .filter(
-                    models.Message.chat_id == chat_id,
-                    models.Chat.user_id == user_id
-                )
-            result = await db.execute(stmt)
-            messages = result.scalars().all()
-
-        if not messages:
-            logger.warning(
-                "No messages found or unauthorized access",
-                extra={
-                    "user_id": user_id,
-                    "extra_data": {"chat_id": str(chat_id)}
-                }
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this chat."
-            )
-
-        logger.debug(
-            f"Retrieved {len(messages)} messages",
-            extra={
-                "user_id": user_id,
-                "extra_data": {
-                    "chat_id": str(chat_id),
-                    "message_count": len(messages)
-                }
-            }
+        stmt = select(models.Chat.id).where(
+            models.Chat.id == chat_id,
+            models.Chat.user_id == user_id
         )
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none() is not None
 
-        return messages
-
-    except HTTPException:
-        raise
     except SQLAlchemyError as e:
         logger.error(
-            f"Failed to fetch chat messages: {e}",
+            f"Failed to check chat ownership: {e}",
             extra={
                 "user_id": user_id,
                 "extra_data": {"chat_id": str(chat_id)}
@@ -310,6 +341,46 @@ async def get_chat_messages(db: AsyncSession, chat_id: UUID, user_id: str):
         raise DatabaseException("Failed to fetch messages", original_error=e)
 
 
+async def stream_chat_messages(chat_id: UUID) -> AsyncIterator[bytes]:
+    """
+    Yield a chat's messages as a JSON array, one chunk per DB batch.
+
+    Opens its own session: the response body is sent after the request's
+    get_async_db session has been released. Ownership must be checked by
+    the caller (see user_owns_chat) before streaming starts.
+    """
+    stmt = select(
+        models.Message.id,
+        models.Message.chat_id,
+        models.Message.sender,
+        models.Message.content,
+        models.Message.timestamp,
+    ).where(
+        models.Message.chat_id == chat_id
+    ).order_by(
+        models.Message.timestamp  # served by ix_messages_chat_id_timestamp
+    ).execution_options(yield_per=CONFIG['MESSAGE_STREAM_BATCH_SIZE'])
+
+    prefix = b'['
+    async with async_session() as db:
+        result = await db.stream(stmt)
+        async for batch in result.partitions():
+            chunk = b','.join(
+                orjson.dumps({
+                    "id": row.id,
+                    "chat_id": row.chat_id,
+                    "sender": row.sender,
+                    "content": row.content,
+                    "timestamp": row.timestamp,
+                })
+                for row in batch
+            )
+            yield prefix + chunk
+            prefix = b','
+
+    yield b'[]' if prefix == b'[' else b']'
+
+
 def _delete_chat_sync(db: Session, chat_id: str):
     """Sync version: Permanently delete chat and all related data (messages, chunks, vectors)"""
 
@@ -319,13 +390,13 @@ def _delete_chat_sync(db: Session, chat_id: str):
     )
 
     try:
-        chat = _get_chat_by_id_sync(db, chat_id)
+        chat = db.get(models.Chat, UUID(str(chat_id)))  # Lean: no joins, identity map first
         if not chat:
             logger.warning(f"Chat not found for deletion: {chat_id}")
             return False
 
         # Store metadata before deletion for logging
-        message_count = len(chat.messages) if chat.messages else 0
+        message_count = chat.message_count
 
         # Clean up vector data first
         try:
@@ -377,13 +448,13 @@ async def delete_chat(db: AsyncSession, chat_id: str):
     )
 
     try:
-        chat = await get_chat_by_id(db, chat_id)
+        chat = await db.get(models.Chat, UUID(str(chat_id)))  # Lean: no joins, identity map first
         if not chat:
             logger.warning(f"Chat not found for deletion: {chat_id}")
             return False
 
         # Store metadata before deletion for logging
-        message_count = len(chat.messages) if chat.messages else 0
+        message_count = chat.message_count
 
         # Clean up vector data first
         try:
@@ -437,7 +508,7 @@ async def soft_delete_chat(db: AsyncSession, chat_id: str):
     )
 
     try:
-        chat = await get_chat_by_id(db, chat_id)
+        chat = await db.get(models.Chat, UUID(str(chat_id)))  # Lean: no joins, identity map first
         if not chat:
             logger.warning(f"Chat not found for soft deletion: {chat_id}")
             return None
@@ -448,21 +519,18 @@ async def soft_delete_chat(db: AsyncSession, chat_id: str):
         chat.is_deleted = True
         chat.deleted_at = now
 
-        # Soft delete all user's AI conversations
-        stmt = select(AIConversation).filter(
-            AIConversation.chat_id == chat_id,
-            ~AIConversation.is_deleted
-        )
+        # Soft delete all user's AI conversations in one UPDATE (no rows loaded)
+        stmt = update(AIConversation)\
+            .where(
+                AIConversation.chat_id == chat.id,
+                ~AIConversation.is_deleted
+            )\
+            .values(is_deleted=True, deleted_at=now)\
+            .execution_options(synchronize_session=False)
         result = await db.execute(stmt)
-        user_conversations = result.scalars().all()
-
-        conversation_count = len(user_conversations)
-        for conversation in user_conversations:
-            conversation.is_deleted = True
-            conversation.deleted_at = now
+        conversation_count = result.rowcount
 
         await db.commit()
-        await db.refresh(chat)
 
         logger.info(
             f"Chat soft deleted successfully: {chat_id}",
@@ -489,41 +557,41 @@ async def soft_delete_chat(db: AsyncSession, chat_id: str):
 # FILE PROCESSING
 # ============================================================================
 
-def extract_txt_from_zip(zip_path: str) -> Optional[str]:
-    """Extract .txt file from zip and return path to extracted file"""
-    
-    logger.debug(f"Extracting txt from zip: {zip_path}")
-    
+def read_txt_from_zip(source: BinaryIO) -> str:
+    """Read the first .txt file of a zip archive straight from the archive"""
+
     try:
-        with track_operation("extract_zip", zip_path=zip_path):
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        with track_operation("extract_zip"):
+            with zipfile.ZipFile(source, 'r') as zip_ref:
                 # Find .txt files in the zip
                 txt_files = [f for f in zip_ref.namelist() if f.endswith('.txt')]
-                
+
                 if not txt_files:
-                    logger.error(f"No .txt file found in zip: {zip_path}")
+                    logger.error("No .txt file found in zip")
                     raise FileProcessingException(
                         "No .txt file found in zip archive",
                         error_code=ErrorCode.INVALID_FILE_FORMAT
                     )
-                
-                # Extract the first .txt file
-                txt_filename = txt_files[0]
-                extract_path = Path(zip_path).parent / f"extracted_{uuid.uuid4().hex}.txt"
-                
-                with zip_ref.open(txt_filename) as source, open(extract_path, 'wb') as target:
-                    target.write(source.read())
-                
-                logger.debug(f"Extracted txt file to: {extract_path}")
-                
-                return str(extract_path)
-    
+
+                # Decode the first .txt file straight from the archive (no extraction to disk)
+                logger.debug(f"Reading txt from zip: {txt_files[0]}")
+                with io.TextIOWrapper(zip_ref.open(txt_files[0]), encoding='utf-8') as text_file:
+                    return text_file.read()
+
+    except FileProcessingException:
+        raise
     except zipfile.BadZipFile as e:
         logger.error(f"Invalid zip file: {e}", exc_info=True)
         raise FileProcessingException(
             "Invalid zip file format",
             error_code=ErrorCode.INVALID_FILE_FORMAT
         )
+    except UnicodeDecodeError as e:
+        logger.error(f"Chat file in zip is not UTF-8: {e}")
+        raise FileProcessingException(
+            "Chat file must be UTF-8 encoded",
+            error_code=ErrorCode.INVALID_FILE_FORMAT
+        )
     except Exception as e:
         logger.error(f"Failed to extract txt from zip: {e}", exc_info=True)
         raise FileProcessingException(
@@ -532,6 +600,103 @@ def extract_txt_from_zip(zip_path: str) -> Optional[str]:
         )
 
 
+def read_whatsapp_text(source: BinaryIO, is_zip: bool) -> str:
+    """Read chat text from an uploaded .txt or .zip file object"""
+
+    source.seek(0)
+    if is_zip:
+        logger.debug("Zip file detected, reading in place...")
+        return read_txt_from_zip(source)
+
+    try:
+        return _decode_upload_text(source)
+    except UnicodeDecodeError as e:
+        logger.error(f"Chat file is not UTF-8: {e}")
+        raise FileProcessingException(
+            "Chat file must be UTF-8 encoded",
+            error_code=ErrorCode.INVALID_FILE_FORMAT
+        )
+
+
+def _decode_upload_text(source: BinaryIO) -> str:
+    """
+    Decode an uploaded .txt as UTF-8.
+
+    Large uploads are already spooled to a temp file, so they are decoded
+    straight from an mmap of it: no heap copy of the raw bytes next to the text.
+    """
+    size = source.seek(0, io.SEEK_END)
+    source.seek(0)
+    if size < CONFIG['MMAP_MIN_BYTES']:
+        # Small uploads may still be in memory; fileno() would force them to disk
+        return source.read().decode('utf-8')
+
+    with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return str(mapped, 'utf-8')
+
+
+def whatsapp_chat_from_text(text: str) -> whatstk.WhatsAppChat:
+    """
+    Build a WhatsAppChat from in-memory text.
+
+    WhatsAppChat.from_source only accepts paths; this runs the same steps as
+    whatstk's df_from_whatsapp (clean text, auto-detect header, parse)
+    without needing a file on disk.
+    """
+    return whatstk.WhatsAppChat(_df_from_str(_clean_text(text)))
+
+
+def _random_uuid_hexes(n: int) -> List[str]:
+    """
+    Generate n random (version 4) UUIDs as 32-char hex strings.
+
+    One os.urandom call for the whole batch instead of one per uuid.uuid4().
+    """
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = bytes((b & 0x0F) | 0x40 for b in raw[6::16])  # version 4
+    raw[8::16] = bytes((b & 0x3F) | 0x80 for b in raw[8::16])  # RFC 4122 variant
+    return [raw[k:k + 16].hex() for k in range(0, 16 * n, 16)]
+
+
+def _build_copy_buffer(
+    chat_id: UUID,
+    ids: List[str],
+    senders: List[Optional[str]],
+    contents: List[str],
+    timestamps: List[Any]
+) -> io.StringIO:
+    """
+    Render one batch of messages as the CSV that _copy_messages loads.
+
+    COPY bypasses the column types, so sender/content are encrypted here
+    exactly as EncryptedText would on a normal INSERT.
+    """
+    encrypt = _ENCRYPTED_TEXT.process_bind_param
+    chat_id_str = str(chat_id)
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for message_id, sender, content, timestamp in zip(ids, senders, contents, timestamps):
+        writer.writerow((
+            message_id,
+            chat_id_str,
+            encrypt(sender, None) if sender is not None else None,  # None -> CSV NULL
+            encrypt(content, None),
+            timestamp.isoformat()
+        ))
+    buf.seek(0)
+    return buf
+
+
+def _copy_messages(db: Session, buf: io.StringIO) -> None:
+    """Load one batch of messages with COPY ... FROM STDIN (psycopg2 only)"""
+    with db.connection().connection.cursor() as cursor:
+        cursor.copy_expert(
+            "COPY messages (id, chat_id, sender, content, timestamp) FROM STDIN WITH (FORMAT csv)",
+            buf
+        )
+
+
 @track_time("save_messages_to_db")
 def save_messages_to_db(db: Session, chat_id: UUID, whatstk_chat) -> int:
     """Save parsed messages to database and return count"""
@@ -542,58 +707,96 @@ def save_messages_to_db(db: Session, chat_id: UUID, whatstk_chat) -> int:
     )
 
     try:
-        messages = []
-
-        # Build Message objects
-        for _, row in whatstk_chat.df.iterrows():
-            message = models.Message(
-                id=str(uuid.uuid4()),
-                chat_id=chat_id,
-                sender=row['username'],
-                content=row['message'],
-                timestamp=row['date']
+        df = whatstk_chat.df
+        senders = df['username'].tolist()
+        contents = df['message'].tolist()
+        timestamps = df['date'].tolist()
+        message_count = len(df)
+
+        # Bulk insert in fixed-size chunks, building each chunk's rows just
+        # before (COPY: one chunk ahead of) inserting it, so memory stays bounded.
+        # PostgreSQL (psycopg2) uses COPY; other drivers fall back to executemany
+        chunk_size = CONFIG['BULK_INSERT_CHUNK']
+        total_batches = (message_count + chunk_size - 1) // chunk_size
+        use_copy = db.get_bind().dialect.driver == 'psycopg2'
+        message_insert = insert(models.Message).execution_options(
+            insertmanyvalues_page_size=chunk_size
+        )
+
+        def build_copy_buffer(start: int, end: int) -> io.StringIO:
+            return _build_copy_buffer(
+                chat_id, _random_uuid_hexes(end - start),
+                senders[start:end], contents[start:end], timestamps[start:end]
             )
-            messages.append(message)
-
-        # Bulk insert with batched commits to keep connection alive
-        BATCH_SIZE = 5000
-        total_batches = (len(messages) + BATCH_SIZE - 1) // BATCH_SIZE
-
-        with track_operation("bulk_insert_messages", message_count=len(messages)):
-            for i in range(0, len(messages), BATCH_SIZE):
-                batch = messages[i:i+BATCH_SIZE]
-                batch_number = i // BATCH_SIZE + 1
-
-                db.bulk_save_objects(batch)
-                db.commit()  # Commit each batch to prevent connection timeout
-
-                logger.debug(
-                    f"Saved batch {batch_number}/{total_batches}",
-                    extra={
-                        "extra_data": {
-                            "chat_id": str(chat_id),
-                            "batch_number": batch_number,
-                            "total_batches": total_batches,
-                            "messages_in_batch": len(batch),
-                            "total_saved": min(i + BATCH_SIZE, len(messages))
+
+        # COPY batches are pipelined: while one batch is on the wire (the
+        # driver releases the GIL), a helper thread encrypts and renders the
+        # next one. Only one batch is prepared ahead, so memory stays bounded
+        builder = ThreadPoolExecutor(max_workers=1) if use_copy else None
+        next_buf = builder.submit(build_copy_buffer, 0, min(chunk_size, message_count)) \
+            if use_copy and message_count else None
+
+        try:
+            with track_operation("bulk_insert_messages", message_count=message_count):
+                for i in range(0, message_count, chunk_size):
+                    end = min(i + chunk_size, message_count)
+                    batch_number = i // chunk_size + 1
+
+                    if use_copy:
+                        # Single COPY statement per batch: no per-row INSERT parsing
+                        buf = next_buf.result()
+                        if end < message_count:
+                            next_buf = builder.submit(
+                                build_copy_buffer, end, min(end + chunk_size, message_count)
+                            )
+                        _copy_messages(db, buf)
+                    else:
+                        # ORM bulk INSERT: the whole chunk goes out as one multi-row
+                        # VALUES statement (insertmanyvalues), no unit-of-work
+                        ids = _random_uuid_hexes(end - i)
+                        db.execute(message_insert, [
+                            {
+                                'id': UUID(ids[j - i]),
+                                'chat_id': chat_id,
+                                'sender': senders[j],
+                                'content': contents[j],
+                                'timestamp': timestamps[j]
+                            }
+                            for j in range(i, end)
+                        ])
+                    db.commit()  # Commit each batch to prevent connection timeout
+
+                    logger.debug(
+                        f"Saved batch {batch_number}/{total_batches}",
+                        extra={
+                            "extra_data": {
+                                "chat_id": str(chat_id),
+                                "batch_number": batch_number,
+                                "total_batches": total_batches,
+                                "messages_in_batch": end - i,
+                                "total_saved": end
+                            }
                         }
-                    }
-                )
+                    )
+        finally:
+            if builder:
+                builder.shutdown(cancel_futures=True)
 
         logger.info(
-            f"Saved {len(messages)} messages to database",
+            f"Saved {message_count} messages to database",
             extra={
                 "extra_data": {
                     "chat_id": str(chat_id),
-                    "message_count": len(messages),
+                    "message_count": message_count,
                     "batches_processed": total_batches
                 }
             }
         )
 
-        return len(messages)
+        return message_count
 
-    except SQLAlchemyError as e:
+    except (SQLAlchemyError, db.get_bind().dialect.dbapi.Error) as e:
+        # The COPY path talks to the driver directly, so its errors are raw DBAPI ones
         db.rollback()
         logger.error(
             f"Failed to save messages: {e}",
@@ -607,15 +810,46 @@ def save_messages_to_db(db: Session, chat_id: UUID, whatstk_chat) -> int:
 # WHATSAPP FILE PROCESSING
 # ============================================================================
 
+def _mark_chat_failed(db: Session, chat: models.Chat, error_message: str) -> None:
+    """Set a chat's status to failed with the error; never raises"""
+    try:
+        db.rollback()  # Discard anything left pending by the failed step
+        # Message batches are committed as they go; drop any partial import
+        db.query(models.Message)\
+            .filter(models.Message.chat_id == chat.id)\
+            .delete(synchronize_session=False)
+        chat.error_log = error_message
+        chat.status = "failed"
+        chat.chat_metadata = None
+        db.commit()
+
+        logger.info(
+            f"Chat marked as failed: {chat.id}",
+            extra={"extra_data": {"chat_id": str(chat.id)}}
+        )
+    except Exception as update_error:
+        logger.error(
+            f"Failed to update chat status: {update_error}",
+            extra={"extra_data": {"chat_id": str(chat.id)}},
+            exc_info=True
+        )
+
+
 @track_time("process_whatsapp_file")
 def process_whatsapp_file(
     chat_id: UUID,
-    file_path: str,
+    source: BinaryIO,
+    filename: str,
+    is_zip: bool,
     db: Session
 ) -> models.Chat:
     """
     Process WhatsApp chat file and store in database
     NOTE: Does NOT trigger vector indexing (lazy loading)
+
+    source is the uploaded file object (UploadFile.file); it is read in
+    place, whether Starlette kept it in memory or spooled it to disk.
+    is_zip comes from the magic-bytes sniff done at upload time.
     """
     
     chat = None
@@ -623,7 +857,7 @@ def process_whatsapp_file(
     
     logger.info(
         "Starting WhatsApp file processing",
-        extra={"extra_data": {"chat_id": str(chat_id), "file_path": file_path}}
+        extra={"extra_data": {"chat_id": str(chat_id), "filename": filename}}
     )
     
     try:
@@ -636,7 +870,7 @@ def process_whatsapp_file(
         
         # Parse the WhatsApp file
         with track_operation("parse_whatsapp_file", chat_id=str(chat_id)):
-            whatstk_chat, participants, title, metadata = parse_whatsapp_file(file_path)
+            whatstk_chat, participants, title, metadata = parse_whatsapp_file(source, filename, is_zip)
         
         logger.info(
             "File parsed successfully",
@@ -654,9 +888,10 @@ def process_whatsapp_file(
 
         # Update chat with parsed information
         chat.title = title
-        chat.participants = json.dumps(participants)
+        chat.participants = participants
         chat.is_group_chat = len(participants) > 2
         chat.participant_count = len(participants)
+        chat.message_count = message_count
         chat.chat_metadata = metadata
         chat.status = "completed"
         chat.error_log = None  # Clear any previous errors
@@ -680,8 +915,10 @@ def process_whatsapp_file(
         
         return chat
         
-    except FileProcessingException:
-        # Re-raise our custom exceptions (already logged)
+    except FileProcessingException as e:
+        # Already logged; record it on the chat so status polling can show it
+        if chat:
+            _mark_chat_failed(db, chat, e.message)
         raise
     
     except Exception as e:
@@ -692,88 +929,39 @@ def process_whatsapp_file(
             extra={
                 "extra_data": {
                     "chat_id": str(chat_id),
-                    "file_path": file_path,
+                    "filename": filename,
                     "error_type": type(e).__name__
                 }
             },
             exc_info=True
         )
         
-        # On any error, mark chat as failed and log error
+        # On any error, mark chat as failed and log error. The failed chat is
+        # kept (not deleted): processing runs after the upload response, so
+        # the client learns about the failure by polling the chat's status
         if chat:
-            try:
-                chat.error_log = error_message
-                chat.status = "failed"
-                chat.chat_metadata = None
-                db.commit()
-                
-                logger.info(
-                    f"Chat marked as failed: {chat_id}",
-                    extra={"extra_data": {"chat_id": str(chat_id)}}
-                )
-            except Exception as update_error:
-                logger.error(
-                    f"Failed to update chat status: {update_error}",
-                    extra={"extra_data": {"chat_id": str(chat_id)}},
-                    exc_info=True
-                )
-        
-        # Delete the failed chat completely
-        try:
-            _delete_chat_sync(db, chat_id)
-            logger.info(
-                f"Failed chat deleted: {chat_id}",
-                extra={"extra_data": {"chat_id": str(chat_id)}}
-            )
-        except Exception as delete_error:
-            logger.error(
-                f"Failed to delete failed chat: {delete_error}",
-                extra={"extra_data": {"chat_id": str(chat_id)}},
-                exc_info=True
-            )
+            _mark_chat_failed(db, chat, error_message)
         
         # Raise as FileProcessingException for proper error handling
         raise FileProcessingException(
             error_message,
             error_code=ErrorCode.CHAT_PROCESSING_FAILED
         )
-   
-    finally:
-        # Always clean up the uploaded file
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Uploaded file cleaned up: {file_path}")
-        except Exception as cleanup_error:
-            logger.warning(
-                f"Failed to clean up uploaded file: {cleanup_error}",
-                extra={"extra_data": {"file_path": file_path}}
-            )
 
 
 @track_time("parse_whatsapp_file")
-def parse_whatsapp_file(file_path: str) -> Tuple[whatstk.WhatsAppChat, List[str], str, Dict[str, Any]]:
+def parse_whatsapp_file(source: BinaryIO, filename: str, is_zip: bool) -> Tuple[whatstk.WhatsAppChat, List[str], str, Dict[str, Any]]:
     """Parse WhatsApp file and return (whatstk_chat, participants_list, title, metadata)"""
     
-    logger.debug(f"Parsing WhatsApp file: {file_path}")
-    
-    extracted_path = None
+    logger.debug(f"Parsing WhatsApp file: {filename}")
     
     try:
-        # Handle zip files
-        if file_path.endswith('.zip'):
-            logger.debug("Zip file detected, extracting...")
-            extracted_path = extract_txt_from_zip(file_path)
-            parse_path = extracted_path
-        else:
-            parse_path = file_path
+        text = read_whatsapp_text(source, is_zip)
         
         # Parse with whatstk
-        logger.debug(f"Parsing with whatstk: {parse_path}")
-        
         with track_operation("whatstk_parse"):
             try:
-                chat = whatstk.WhatsAppChat.from_source(parse_path)
+                chat = whatsapp_chat_from_text(text)
             except Exception as e:
                 logger.error(f"whatstk parsing failed: {e}", exc_info=True)
                 raise FileProcessingException(
@@ -782,8 +970,7 @@ def parse_whatsapp_file(file_path: str) -> Tuple[whatstk.WhatsAppChat, List[str]
                 )
         
         # Extract participants
-        participants = list(chat.df['username'].unique())
-        participants = [p for p in participants if p is not None]  # Remove None values
+        participants = chat.df['username'].dropna().unique().tolist()  # Drop missing senders in pandas
         
         if not participants:
             logger.error("No participants found in chat")
@@ -823,43 +1010,43 @@ def parse_whatsapp_file(file_path: str) -> Tuple[whatstk.WhatsAppChat, List[str]
     except Exception as e:
         logger.error(
             f"Failed to parse WhatsApp file: {e}",
-            extra={"extra_data": {"file_path": file_path}},
+            extra={"extra_data": {"filename": filename}},
             exc_info=True
         )
         raise FileProcessingException(
             f"Failed to parse WhatsApp file: {str(e)}",
             error_code=ErrorCode.CHAT_PROCESSING_FAILED
         )
-    
-    finally:
-        # Clean up extracted file if it exists
-        if extracted_path and os.path.exists(extracted_path):
-            try:
-                os.remove(extracted_path)
-                logger.debug(f"Extracted file cleaned up: {extracted_path}")
-            except Exception as e:
-                logger.warning(
-                    f"Failed to clean up extracted file: {e}",
-                    extra={"extra_data": {"extracted_path": extracted_path}}
-                )
 
 
 # ============================================================================
 # METADATA COMPUTATION HELPERS
 # ============================================================================
 
-def get_stopwords() -> set:
-    """Get combined English, Hindi and WhatsApp noise stopwords"""
+def _load_stopwords() -> frozenset:
+    """Combine English, Hindi and WhatsApp noise stopwords"""
     try:
-        english_stopwords = set(stopwords.words('english'))
+        english_stopwords = stopwords.words('english')
     except:  # noqa: E722
         logger.warning("Failed to load English stopwords")
-        english_stopwords = set()
+        english_stopwords = []
+
+    return frozenset(english_stopwords).union(
+        CONFIG['HINDI_STOPWORDS'], CONFIG['WHATSAPP_NOISE_WORDS']
+    )
 
-    hindi_stopwords = set(CONFIG['HINDI_STOPWORDS'])
-    whatsapp_noise = set(CONFIG['WHATSAPP_NOISE_WORDS'])
-    return english_stopwords.union(hindi_stopwords).union(whatsapp_noise)
 
+# Built once at import: stopwords.words() re-reads the NLTK corpus file per call
+STOPWORDS = _load_stopwords()
+
+
+# Every codepoint that occurs in some emoji; text sharing none of them has no
+# emojis, so emoji.emoji_list (a full scan) can be skipped
+_EMOJI_CODEPOINTS = frozenset(''.join(emoji.EMOJI_DATA))
+
+# str.translate table deleting single-codepoint emojis (same set as checking
+# each character against EMOJI_DATA)
+_EMOJI_DELETE_TABLE = dict.fromkeys(ord(e) for e in emoji.EMOJI_DATA if len(e) == 1)
 
 _SKIN_TONE_MODIFIERS = frozenset([
     '\U0001F3FB', '\U0001F3FC', '\U0001F3FD', '\U0001F3FE', '\U0001F3FF',
@@ -870,7 +1057,7 @@ def extract_emojis(text: str) -> List[str]:
 
     e.g. 🙏🏼 and 🙏 both count as 🙏 so usage totals stay meaningful.
     """
-    if pd.isna(text):
+    if not isinstance(text, str) or _EMOJI_CODEPOINTS.isdisjoint(text):
         return []
     return [
         ''.join(c for c in item['emoji'] if c not in _SKIN_TONE_MODIFIERS)
@@ -878,140 +1065,214 @@ def extract_emojis(text: str) -> List[str]:
     ]
 
 
+# Compiled once; these run per message over the whole chat
+_LINK_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_URL_STRIP_RE = re.compile(r'http[s]?://\S+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_DELETED_RE = re.compile(r'this message was deleted|you deleted this message', re.IGNORECASE)
+_MEDIA_RE = re.compile(r'<Media omitted>|(?i:<attached:)')
+# _DELETED_RE and _MEDIA_RE as one alternation, so a message is scanned once
+_DELETED_OR_MEDIA_RE = re.compile(
+    r'(?P<deleted>(?i:this message was deleted|you deleted this message))'
+    r'|(?P<media><Media omitted>|(?i:<attached:))'
+)
+_CALL_RE = re.compile(
+    r'^(missed|incoming|outgoing)\s+(voice|video)\s+call'
+    r'|^(voice|video)\s+call'
+    r'|^you\s+(called|missed)'
+    r'|^(null|none)$'
+)
+
+
 def extract_links(text: str) -> List[str]:
     """Extract URLs from text"""
-    if pd.isna(text):
+    if not isinstance(text, str):
         return []
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    return re.findall(url_pattern, text)
+    return _LINK_RE.findall(text)
 
 
 def is_deleted_message(text: str) -> bool:
     """Check if message was deleted"""
-    if pd.isna(text):
+    if not isinstance(text, str):
         return False
-    pattern = r'(this message was deleted|you deleted this message)'
-    return bool(re.search(pattern, str(text).lower()))
+    return bool(_DELETED_RE.search(text))
 
 
 def is_media_message(text: str) -> bool:
     """Check if message is media"""
-    if pd.isna(text):
+    if not isinstance(text, str):
         return False
-    return '<Media omitted>' in str(text) or '<attached:' in str(text).lower()
+    return bool(_MEDIA_RE.search(text))
 
 
 def is_call_message(text: str) -> bool:
     """Check if message is a WhatsApp call notification (missed/incoming/outgoing calls)"""
-    if pd.isna(text):
+    if not isinstance(text, str):
         return False
-    text_lower = str(text).lower().strip()
-    call_patterns = [
-        r'^(missed|incoming|outgoing)\s+(voice|video)\s+call',
-        r'^(voice|video)\s+call',
-        r'^you\s+(called|missed)',
-        r'^(null|none)$',
-    ]
-    return any(re.search(p, text_lower) for p in call_patterns)
+    return bool(_CALL_RE.search(text.lower().strip()))
 
 
-def extract_words(text: str, stopwords_set: set) -> List[str]:
+def extract_words(text: str, stopwords_set: frozenset) -> List[str]:
     """Extract words from text, filtering stopwords"""
-    if pd.isna(text) or is_deleted_message(text) or is_media_message(text) or is_call_message(text):
+    if not isinstance(text, str) or is_deleted_message(text) or is_media_message(text) or is_call_message(text):
         return []
     
-    # Remove URLs, emojis, and special characters
-    text = re.sub(r'http[s]?://\S+', '', text)
-    text = ''.join(c for c in text if c not in emoji.EMOJI_DATA)
+    # Remove URLs, emojis, and special characters; most messages have neither
+    # a URL nor an emoji, so both passes are skipped after a cheap C-level check
+    if 'http' in text:
+        text = _URL_STRIP_RE.sub('', text)
+    if not _EMOJI_CODEPOINTS.isdisjoint(text):
+        text = text.translate(_EMOJI_DELETE_TABLE)
     
     # Extract words (alphanumeric only)
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    words = _WORD_RE.findall(text.lower())
     
     # Filter stopwords and short words
     return [w for w in words if w not in stopwords_set and len(w) > 2]
 
 
-def calculate_response_times(df: pd.DataFrame, user: str, max_hours: float = 4) -> List[float]:
-    """Calculate response times for a user (in seconds)"""
-    response_times = []
+def classify_messages(messages: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Classify every message in one pass: (is_deleted, is_media, links).
+
+    Uses the same patterns as is_deleted_message/is_media_message/extract_links,
+    but scans each distinct message once and broadcasts the results back.
+    Missing messages are neither deleted nor media and have no links.
+    """
+    codes, distinct = pd.factorize(messages)  # missing messages get code -1
+
+    # One extra trailing slot holds the result for code -1 (missing message)
+    deleted = np.zeros(len(distinct) + 1, dtype=bool)
+    media = np.zeros(len(distinct) + 1, dtype=bool)
+    links = np.empty(len(distinct) + 1, dtype=object)
+    links[-1] = []
+    for i, message in enumerate(distinct):
+        for match in _DELETED_OR_MEDIA_RE.finditer(message):
+            if match.lastgroup == 'deleted':
+                deleted[i] = True
+            else:
+                media[i] = True
+            if deleted[i] and media[i]:
+                break
+        links[i] = _LINK_RE.findall(message)
+
+    return (
+        pd.Series(deleted[codes], index=messages.index),
+        pd.Series(media[codes], index=messages.index),
+        pd.Series(links[codes], index=messages.index)
+    )
+
+
+def _count_tokens(
+    tokens: pd.Series,
+    usernames: pd.Series
+) -> Tuple[pd.Series, Dict[str, pd.Series]]:
+    """
+    Count the tokens in a Series of per-message token lists, overall and per user.
+
+    Counts are sorted most common first, ties in order of first appearance
+    (the same order as Counter.most_common).
+    """
+    flat = pd.DataFrame({'username': usernames, 'token': tokens})\
+        .explode('token')\
+        .dropna(subset=['token'])
+
+    totals = flat['token'].value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    by_user = {
+        username: counts.droplevel(0).sort_values(ascending=False, kind='stable')
+        for username, counts in flat.groupby(['username', 'token'], sort=False, observed=True)
+            .size()
+            .groupby(level=0, sort=False, observed=True)
+    }
+    return totals, by_user
+
+
+def count_words_and_emojis(
+    messages: pd.Series,
+    usernames: pd.Series
+) -> Tuple[pd.Series, pd.Series, Dict[str, pd.Series], Dict[str, pd.Series]]:
+    """
+    Count words and emojis over the whole chat and per user.
+
+    Returns (word_counts, emoji_counts, words_by_user, emojis_by_user), each
+    count Series sorted most common first; users with no words or emojis are
+    missing from the per-user dicts.
+    """
+    # Chats repeat a lot of messages verbatim ("ok", "👍", "<Media omitted>"),
+    # so each distinct message is tokenized only once
+    codes, distinct = pd.factorize(messages)  # missing messages get code -1
+
+    # One extra trailing slot holds the (empty) tokens for code -1
+    words = np.empty(len(distinct) + 1, dtype=object)
+    emojis = np.empty(len(distinct) + 1, dtype=object)
+    words[-1] = emojis[-1] = []
+    for i, message in enumerate(distinct):
+        words[i] = extract_words(message, STOPWORDS)
+        emojis[i] = extract_emojis(message)
+
+    word_counts, words_by_user = _count_tokens(pd.Series(words[codes], index=messages.index), usernames)
+    emoji_counts, emojis_by_user = _count_tokens(pd.Series(emojis[codes], index=messages.index), usernames)
+
+    return word_counts, emoji_counts, words_by_user, emojis_by_user
+
+
+def calculate_response_times(df_sorted: pd.DataFrame, max_hours: float = 4) -> Dict[str, List[float]]:
+    """Calculate response times (in seconds) for every user; df must be sorted by date"""
     max_seconds = max_hours * 3600
     
-    df_sorted = df.sort_values('date').reset_index(drop=True)
+    users = df_sorted['username'].to_numpy()
+    user_codes = pd.factorize(users)[0]  # compare ints, not Python strings
+    gaps = np.diff(df_sorted['date'].to_numpy()) / np.timedelta64(1, 's')
     
-    for i in range(1, len(df_sorted)):
-        current_msg = df_sorted.iloc[i]
-        previous_msg = df_sorted.iloc[i-1]
-        
-        # Check if current user is responding to different user
-        if current_msg['username'] == user and previous_msg['username'] != user:
-            time_diff = (current_msg['date'] - previous_msg['date']).total_seconds()
-            
-            # Only count if within reasonable time window
-            if 0 < time_diff < max_seconds:
-                response_times.append(time_diff)
+    # A user responding to a different user, within a reasonable window
+    is_response = (user_codes[1:] != user_codes[:-1]) & (gaps > 0) & (gaps < max_seconds)
     
-    return response_times
+    return pd.Series(gaps[is_response])\
+        .groupby(users[1:][is_response], sort=False)\
+        .agg(list)\
+        .to_dict()
 
 
-def detect_conversation_initiations(df: pd.DataFrame, gap_hours: float = 6) -> Dict[str, int]:
-    """Count conversation initiations per user"""
-    initiations = {user: 0 for user in df['username'].unique() if pd.notna(user)}
+def detect_conversation_initiations(df_sorted: pd.DataFrame, gap_hours: float = 6) -> Dict[str, int]:
+    """Count conversation initiations per user; df must be sorted by date"""
+    initiations = {user: 0 for user in df_sorted['username'].unique() if pd.notna(user)}
     
-    df_sorted = df.sort_values('date').reset_index(drop=True)
-    gap_threshold = timedelta(hours=gap_hours)
+    users = df_sorted['username'].to_numpy()
+    gaps = np.diff(df_sorted['date'].to_numpy())
     
-    # First message is an initiation
-    if len(df_sorted) > 0:
-        first_user = df_sorted.iloc[0]['username']
-        if pd.notna(first_user):
-            initiations[first_user] += 1
+    # The first message, and every message after a long enough gap, starts a conversation
+    starts = np.flatnonzero(gaps >= np.timedelta64(timedelta(hours=gap_hours))) + 1
+    if len(users) > 0:
+        starts = np.concatenate(([0], starts))
     
-    for i in range(1, len(df_sorted)):
-        current_msg = df_sorted.iloc[i]
-        previous_msg = df_sorted.iloc[i-1]
-        
-        time_gap = current_msg['date'] - previous_msg['date']
-        
-        if time_gap >= gap_threshold:
-            current_user = current_msg['username']
-            if pd.notna(current_user):
-                initiations[current_user] += 1
+    for user, count in pd.Series(users[starts]).value_counts().items():
+        initiations[user] += int(count)
     
     return initiations
 
 
-def calculate_double_texting(df: pd.DataFrame, threshold: int = 2) -> Dict[str, float]:
-    """Calculate double texting rate per user"""
-    double_text_counts = {user: 0 for user in df['username'].unique() if pd.notna(user)}
-    total_sequences = {user: 0 for user in df['username'].unique() if pd.notna(user)}
+def calculate_double_texting(df_sorted: pd.DataFrame, threshold: int = 2) -> Dict[str, float]:
+    """Calculate double texting rate per user; df must be sorted by date"""
+    users = df_sorted['username'].to_numpy()
+    user_codes = pd.factorize(users)[0]  # compare ints, not Python strings
     
-    df_sorted = df.sort_values('date').reset_index(drop=True)
-    
-    i = 0
-    while i < len(df_sorted):
-        current_user = df_sorted.iloc[i]['username']
-        if pd.isna(current_user):
-            i += 1
-            continue
-        
-        # Count consecutive messages from same user
-        consecutive_count = 1
-        j = i + 1
-        while j < len(df_sorted) and df_sorted.iloc[j]['username'] == current_user:
-            consecutive_count += 1
-            j += 1
-        
-        total_sequences[current_user] += 1
-        if consecutive_count >= threshold:
-            double_text_counts[current_user] += 1
-        
-        i = j
+    # Run-length encode consecutive messages from the same user
+    run_starts = np.flatnonzero(np.concatenate(([len(users) > 0], user_codes[1:] != user_codes[:-1])))
+    runs = pd.DataFrame({
+        'user': users[run_starts],
+        'length': np.diff(np.append(run_starts, len(users)))
+    }).dropna(subset=['user'])
+    runs['is_double_text'] = runs['length'] >= threshold
+    per_user = runs.groupby('user')['is_double_text'].agg(['size', 'sum'])
     
     # Calculate percentages
     rates = {}
-    for user in double_text_counts:
-        if total_sequences[user] > 0:
-            rates[user] = (double_text_counts[user] / total_sequences[user]) * 100
+    for user in df_sorted['username'].unique():
+        if pd.isna(user):
+            continue
+        if user in per_user.index:
+            total_sequences, double_text_count = per_user.loc[user]
+            rates[user] = (int(double_text_count) / int(total_sequences)) * 100
         else:
             rates[user] = 0.0
     
@@ -1025,13 +1286,8 @@ def get_hourly_distribution(df: pd.DataFrame, user: str = None) -> List[int]:
     else:
         user_df = df
     
-    hours = user_df['date'].dt.hour
-    distribution = [0] * 24
-    
-    for hour in range(24):
-        distribution[hour] = (hours == hour).sum()
-    
-    return distribution
+    hours = user_df['date'].dt.hour.to_numpy()
+    return np.bincount(hours, minlength=24).tolist()
 
 
 def get_daily_distribution(df: pd.DataFrame, user: str = None) -> Dict[str, int]:
@@ -1042,9 +1298,28 @@ def get_daily_distribution(df: pd.DataFrame, user: str = None) -> Dict[str, int]
         user_df = df
     
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    day_counts = user_df['date'].dt.dayofweek.value_counts().to_dict()
+    day_counts = np.bincount(user_df['date'].dt.dayofweek.to_numpy(), minlength=7)
     
-    return {days[i]: day_counts.get(i, 0) for i in range(7)}
+    return dict(zip(days, day_counts.tolist()))
+
+
+def _to_native(value: Any) -> Any:
+    """
+    Recursively convert numpy scalars in dicts/lists to Python types.
+
+    Same result as json.loads(json.dumps(value, default=int)) for metadata
+    (numpy ints and bools become int, tuples become lists) without
+    serializing the whole structure to a string and back.
+    """
+    if isinstance(value, dict):
+        return {key: _to_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_native(item) for item in value]
+    if isinstance(value, (np.integer, np.bool_)):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    return value
 
 
 # ============================================================================
@@ -1061,7 +1336,6 @@ def compute_chat_metadata(chat: whatstk.WhatsAppChat, participants: List[str]) -
     
     try:
         df = chat.df
-        stopwords_set = get_stopwords()
         
         # Global stats
         total_messages = len(df)
@@ -1085,48 +1359,52 @@ def compute_chat_metadata(chat: whatstk.WhatsAppChat, participants: List[str]) -
             for date, count in messages_by_date.items()
         }
 
+        # Per-message flags, computed once for the whole chat; per-user totals
+        # come from a single groupby below instead of re-scanning df per user
+        messages = df['message']
+        # Categorical usernames: every groupby below reuses the same integer
+        # codes instead of re-hashing the username strings
+        usernames = df['username'].astype('category')
+        is_deleted, is_media, message_links = classify_messages(messages)
+        is_valid = ~is_deleted & ~is_media
+
         # Deleted messages
-        deleted_messages_count = df['message'].apply(is_deleted_message).sum()
+        deleted_messages_count = is_deleted.sum()
         
-        # Media and links
-        all_links = []
-        for _, row in df.iterrows():
-            links = extract_links(row['message'])
-            for link in links:
-                all_links.append({
-                    'url': link,
-                    'user': row['username'],
-                    'timestamp': row['date'].isoformat()
-                })
+        # Media and links: one row per link, in message order
+        links_df = df[['username', 'date']]\
+            .assign(url=message_links)\
+            .explode('url')\
+            .dropna(subset=['url'])
         
         # Limit links if too many
-        if len(all_links) > CONFIG['MAX_LINKS_STORED']:
+        if len(links_df) > CONFIG['MAX_LINKS_STORED']:
             logger.debug(
-                f"Truncating links from {len(all_links)} to {CONFIG['MAX_LINKS_STORED']}"
+                f"Truncating links from {len(links_df)} to {CONFIG['MAX_LINKS_STORED']}"
             )
-            all_links = all_links[:CONFIG['MAX_LINKS_STORED']]
+            links_df = links_df.head(CONFIG['MAX_LINKS_STORED'])
+        
+        all_links = [
+            {'url': url, 'user': username, 'timestamp': date.isoformat()}
+            for url, username, date in zip(links_df['url'], links_df['username'], links_df['date'])
+        ]
         
         links_shared_count = len(all_links)
-        media_shared_count = df['message'].apply(is_media_message).sum()
+        media_shared_count = is_media.sum()
         
         # Global word and emoji analysis
         logger.debug("Analyzing words and emojis")
         
-        all_words = []
-        all_emojis = []
+        word_counts, emoji_counts, user_word_counts, user_emoji_counts = \
+            count_words_and_emojis(messages, usernames)
+        no_counts = pd.Series(dtype='int64')
         
-        for msg in df['message']:
-            all_words.extend(extract_words(msg, stopwords_set))
-            all_emojis.extend(extract_emojis(msg))
-        
-        total_words = len(all_words)
-        word_counter = Counter(all_words)
-        emoji_counter = Counter(all_emojis)
+        total_words = word_counts.sum()
         
         top_words = [{'word': word, 'count': count} 
-                     for word, count in word_counter.most_common(CONFIG['TOP_WORDS_LIMIT'])]
+                     for word, count in word_counts.head(CONFIG['TOP_WORDS_LIMIT']).items()]
         top_emojis = [{'emoji': emoji, 'count': count} 
-                      for emoji, count in emoji_counter.most_common(CONFIG['TOP_EMOJIS_LIMIT'])]
+                      for emoji, count in emoji_counts.head(CONFIG['TOP_EMOJIS_LIMIT']).items()]
         
         # Temporal patterns
         hourly_dist = get_hourly_distribution(df)
@@ -1135,81 +1413,95 @@ def compute_chat_metadata(chat: whatstk.WhatsAppChat, participants: List[str]) -
         busiest_hour = hourly_dist.index(max(hourly_dist)) if hourly_dist else 0
         busiest_day = max(daily_dist, key=daily_dist.get) if daily_dist else 'Monday'
         
-        # Conversation initiations
+        # Conversation initiations; the sequence-based stats share one sort
         logger.debug("Computing conversation patterns")
-        initiations = detect_conversation_initiations(df, CONFIG['CONVERSATION_GAP_HOURS'])
+        df_sorted = df.sort_values('date')
+        initiations = detect_conversation_initiations(df_sorted, CONFIG['CONVERSATION_GAP_HOURS'])
         
         # Double texting rates
-        double_text_rates = calculate_double_texting(df, CONFIG['DOUBLE_TEXT_THRESHOLD'])
+        double_text_rates = calculate_double_texting(df_sorted, CONFIG['DOUBLE_TEXT_THRESHOLD'])
+        
+        # Response times for every user from one scan of the sorted chat
+        response_times_by_user = calculate_response_times(df_sorted, CONFIG['MAX_RESPONSE_TIME_HOURS'])
         
         # Per-user stats
         logger.debug(f"Computing per-user stats for {len(participants)} participants")
         
+        char_len = messages.str.len()
+        user_totals = pd.DataFrame({
+            'username': usernames,
+            'deleted': is_deleted,
+            'media': is_media,
+            'valid': is_valid,
+            'valid_chars': char_len.where(is_valid),
+            'links': message_links.str.len(),
+            'questions': messages.str.contains('?', na=False, regex=False),
+        }).groupby('username', observed=True).sum().to_dict('index')
+        no_totals = dict.fromkeys(('deleted', 'media', 'valid', 'valid_chars', 'links', 'questions'), 0)
+        
+        # Each user's longest valid (not deleted/media) message, by row label
+        valid_char_len = char_len[is_valid].dropna()
+        longest_message_idx = valid_char_len\
+            .groupby(usernames[valid_char_len.index], sort=False, observed=True)\
+            .idxmax()\
+            .to_dict()
+        
+        # Every user's hourly distribution from one groupby over (user, hour)
+        user_hourly_dists = df.groupby([usernames, df['date'].dt.hour], observed=True)\
+            .size()\
+            .unstack(fill_value=0)\
+            .reindex(columns=range(24), fill_value=0)
+        message_counts = user_hourly_dists.sum(axis=1).to_dict()
+        user_hourly_dists = dict(zip(user_hourly_dists.index, user_hourly_dists.to_numpy().tolist()))
+        no_hourly = [0] * 24
+        
         user_stats = {}
         
         for user in participants:
             if pd.isna(user):
                 continue
             
-            user_df = df[df['username'] == user]
+            totals = user_totals.get(user, no_totals)
             
             # Basic counts
-            message_count = len(user_df)
+            message_count = message_counts.get(user, 0)
             
             # Words
-            user_words = []
-            for msg in user_df['message']:
-                user_words.extend(extract_words(msg, stopwords_set))
-            
-            word_count = len(user_words)
+            user_word_count = user_word_counts.get(user, no_counts)
+            word_count = user_word_count.sum()
             avg_words_per_message = word_count / message_count if message_count > 0 else 0
             
             # Character count (excluding deleted/media)
-            valid_messages = user_df[
-                ~user_df['message'].apply(is_deleted_message) & 
-                ~user_df['message'].apply(is_media_message)
-            ]
-            total_chars = valid_messages['message'].str.len().sum()
-            avg_message_length_chars = total_chars / len(valid_messages) if len(valid_messages) > 0 else 0
+            total_chars = totals['valid_chars']
+            avg_message_length_chars = total_chars / totals['valid'] if totals['valid'] > 0 else 0
             
-            # Deleted and media
-            user_deleted = user_df['message'].apply(is_deleted_message).sum()
-            user_media = user_df['message'].apply(is_media_message).sum()
-            
-            # Links
-            user_links = 0
-            for msg in user_df['message']:
-                user_links += len(extract_links(msg))
-            
-            # Questions
-            questions_asked = user_df['message'].str.contains('?', na=False, regex=False).sum()
+            # Deleted, media, links and questions
+            user_deleted = totals['deleted']
+            user_media = totals['media']
+            user_links = totals['links']
+            questions_asked = totals['questions']
             
             # Response times
-            response_times = calculate_response_times(df, user, CONFIG['MAX_RESPONSE_TIME_HOURS'])
+            response_times = response_times_by_user.get(user, [])
             avg_response_time = sum(response_times) / len(response_times) if response_times else 0
             
             # Top words and emojis for user
-            user_word_counter = Counter(user_words)
             user_top_words = [{'word': word, 'count': count} 
-                              for word, count in user_word_counter.most_common(CONFIG['TOP_WORDS_LIMIT'])]
-            
-            user_emojis = []
-            for msg in user_df['message']:
-                user_emojis.extend(extract_emojis(msg))
+                              for word, count in user_word_count.head(CONFIG['TOP_WORDS_LIMIT']).items()]
             
-            user_emoji_counter = Counter(user_emojis)
             user_top_emojis = [{'emoji': emoji, 'count': count} 
-                               for emoji, count in user_emoji_counter.most_common(CONFIG['TOP_EMOJIS_LIMIT'])]
+                               for emoji, count in user_emoji_counts.get(user, no_counts)
+                                   .head(CONFIG['TOP_EMOJIS_LIMIT']).items()]
             
             # Temporal patterns
-            user_hourly = get_hourly_distribution(df, user)
+            user_hourly = user_hourly_dists.get(user, no_hourly)
             user_busiest_hour = user_hourly.index(max(user_hourly)) if user_hourly else 0
             
             # Longest message
-            longest_msg_idx = valid_messages['message'].str.len().idxmax() if len(valid_messages) > 0 else None
+            longest_msg_idx = longest_message_idx.get(user)
             if longest_msg_idx is not None:
-                longest_msg = valid_messages.loc[longest_msg_idx]
-                longest_words = len(extract_words(longest_msg['message'], set()))  # Count all words
+                longest_msg = df.loc[longest_msg_idx]
+                longest_words = len(extract_words(longest_msg['message'], frozenset()))  # Count all words
                 message_text = str(longest_msg['message'])
                 # Trim message to 500 characters to avoid bloating metadata
                 trimmed_message = message_text[:500] + '...' if len(message_text) > 500 else message_text
@@ -1273,8 +1565,8 @@ def compute_chat_metadata(chat: whatstk.WhatsAppChat, participants: List[str]) -
             }
         )
         
-        # Forces conversion to ensure all values are JSON serializable
-        return json.loads(json.dumps(metadata, default=int))
+        # Convert numpy scalars to native types so the result is JSON serializable
+        return _to_native(metadata)
     
     except Exception as e:
         logger.error(
@@ -0,0 +1,75 @@
+# src/chats/tasks.py
+"""
+Celery tasks for chat lifecycle
+
+Key features:
+- Permanent chat cleanup runs on the worker pool, not in the API process
+- Each task opens (and closes) its own database session
+- Survives API restarts: the task stays queued until a worker acks it
+"""
+
+from uuid import UUID
+from contextlib import contextmanager
+
+from ..celery_app import celery_app
+from ..database import SessionLocal
+from ..logging_config import get_logger
+from . import service
+from .models import Chat
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# DATABASE SESSION CONTEXT MANAGER (Reused from vector/tasks.py pattern)
+# ============================================================================
+
+@contextmanager
+def get_db_session():
+    """Context manager for database session with automatic cleanup"""
+    db = SessionLocal()
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ============================================================================
+# PERMANENT DELETE TASK
+# ============================================================================
+
+@celery_app.task(name="delete_chat", bind=True, max_retries=2)
+def delete_chat(self, chat_id: str):
+    """
+    Permanently delete a soft-deleted chat (messages, chunks, vectors)
+
+    Args:
+        chat_id: UUID of chat to delete
+
+    Idempotent: a chat that is already gone counts as success.
+    Retries: if the delete fails and the chat still exists.
+    """
+
+    logger.info(
+        "Starting permanent chat deletion task",
+        extra={"extra_data": {
+            "task_id": self.request.id,
+            "chat_id": chat_id,
+            "retry_attempt": self.request.retries
+        }}
+    )
+
+    with get_db_session() as db:
+        if service._delete_chat_sync(db, chat_id):
+            return {"success": True, "chat_id": chat_id}
+
+        # _delete_chat_sync returns False both for "not found" and for a
+        # rolled-back delete; only the latter is worth retrying
+        still_exists = db.query(Chat.id).filter(Chat.id == UUID(chat_id)).first()
+        if still_exists:
+            raise self.retry(countdown=30)
+
+        return {"success": True, "chat_id": chat_id, "already_deleted": True}
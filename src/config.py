@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     ENCRYPTION_KEY: str
     MAX_UPLOAD_SIZE_MB: int = 25
     MAX_UPLOAD_SIZE_BYTES: int = MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    MAX_CONCURRENT_UPLOADS: int = 2  # Uploads parsed at once per worker
 
     # Redis & Celery - CHANGED: Use environment variable
     REDIS_URL: str = Field(default="redis://localhost:6379/0")
@@ -28,6 +29,7 @@ class Settings(BaseSettings):
     # This gives tasks time to cleanup before hard kill
     INSIGHT_GENERATION_TIMEOUT: int = 600  # 10 minutes per insight
     RAG_CHUNK_CACHE_TTL: int = 3600  # Cache RAG chunks for 1 hour
+    CREDIT_PACKAGES_CACHE_TTL: int = 60  # Cache the public credit package list for 1 minute
     
     # Vector Database Settings
     # QDRANT_HOST: str = os.getenv("QDRANT_HOST", "localhost")
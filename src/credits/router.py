@@ -7,19 +7,25 @@ Endpoints:
 - GET /credits/packages
 """
 
-from typing import Annotated
+import time
+from typing import Annotated, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..auth.dependencies import get_current_user_id
+from ..config import settings
 from ..database import get_async_db 
 from . import schemas
+from .models import CreditPackage, CreditTransaction
 from .service import CreditService
 
 router = APIRouter(prefix="/credits", tags=["credits"])
 
+# Process-local cache for the public package list: (expires_at, packages)
+_packages_cache: Optional[Tuple[float, List[schemas.CreditPackageResponse]]] = None
+
 
 @router.get("/balance", response_model=schemas.CreditBalanceResponse)
 async def get_credit_balance(
@@ -51,32 +57,48 @@ async def get_transaction_history(
     # Since it's a simple SELECT and not performance-critical, we can run it
     # efficiently using async + scalar results.
 
-    from sqlalchemy import desc, select
-
-    from .models import CreditTransaction
-
-    # Total count
-    total_result = await db.execute(
-        select(CreditTransaction).where(CreditTransaction.user_id == user_id)
-    )
-    total_count = len(total_result.scalars().all())  # or use scalar(count()) if you add it
-
-    # Paginated transactions
+    # Paginated transactions, with the total count folded into the same query
+    # as a window function (one round trip instead of a separate COUNT)
     result = await db.execute(
-        select(CreditTransaction)
+        select(CreditTransaction, func.count().over().label("total_count"))
         .where(CreditTransaction.user_id == user_id)
         .order_by(desc(CreditTransaction.created_at))
         .limit(limit)
         .offset(offset)
     )
-    transactions = result.scalars().all()
+    rows = result.all()
+    transactions = [row.CreditTransaction for row in rows]
+
+    if rows:
+        total_count = rows[0].total_count
+    elif offset == 0:
+        total_count = 0
+    else:
+        # Paged past the end: no row to read the window count from
+        total_count = await db.scalar(
+            select(func.count())
+            .select_from(CreditTransaction)
+            .where(CreditTransaction.user_id == user_id)
+        )
 
     # Current balance (reuse async method)
     current_balance = await CreditService.get_balance_async(db, user_id)
 
+    # Rows come straight from the DB, so skip per-row pydantic validation
+    # (enums are unwrapped to their values, which validation would otherwise do)
     return schemas.TransactionHistoryResponse(
         transactions=[
-            schemas.CreditTransactionResponse.from_orm(t) for t in transactions
+            schemas.CreditTransactionResponse.model_construct(
+                id=t.id,
+                type=t.type.value,
+                amount=t.amount,
+                balance_after=t.balance_after,
+                description=t.description,
+                status=t.status.value,
+                created_at=t.created_at,
+                chat_id=t.chat_id,
+            )
+            for t in transactions
         ],
         total_count=total_count,
         current_balance=current_balance,
@@ -87,8 +109,13 @@ async def get_transaction_history(
 async def get_credit_packages(
     db: AsyncSession = Depends(get_async_db),
 ):
-    """Get available credit packages (public endpoint - async)"""
-    from .models import CreditPackage
+    """Get available credit packages (public endpoint - async, cached for a minute)"""
+    global _packages_cache
+
+    # Packages only change with a deploy/seed, so serve them from memory
+    # instead of querying on every anonymous request
+    if _packages_cache and _packages_cache[0] > time.monotonic():
+        return _packages_cache[1]
 
     result = await db.execute(
         select(CreditPackage)
@@ -97,4 +124,7 @@ async def get_credit_packages(
     )
     packages = result.scalars().all()
 
-    return [schemas.CreditPackageResponse.from_orm(p) for p in packages]
\ No newline at end of file
+    response = [schemas.CreditPackageResponse.from_orm(p) for p in packages]
+    _packages_cache = (time.monotonic() + settings.CREDIT_PACKAGES_CACHE_TTL, response)
+
+    return response
\ No newline at end of file
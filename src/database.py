@@ -52,21 +52,20 @@ else:
         settings.DATABASE_URL,
         poolclass=QueuePool,
         pool_pre_ping=True,
-        pool_size=10,               # Increased from 2
-        max_overflow=5,             # Allow overflow connections
-        pool_timeout=10,            # Fail faster if no connections available
-        pool_recycle=3600,          # Increased from 280 - recycle hourly
-        echo=False,                # Set to True for SQL debugging
-        echo_pool=True,          # Uncomment to debug pool behavior
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,    # Fail faster if no connections available
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        echo=settings.DB_ECHO_ENABLED,            # Set DB_ECHO_ENABLED=true for SQL debugging
     )
     logger.info(
         "Database engine configured for API",
         extra={"extra_data": {
             "pool_type": "QueuePool",
-            "pool_size": 10,
-            "max_overflow": 5,
-            "total_max_connections": 15,
-            "pool_recycle_seconds": 3600
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "total_max_connections": settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+            "pool_recycle_seconds": settings.DB_POOL_RECYCLE
         }}
     )
 
@@ -144,14 +143,14 @@ ASYNC_DATABASE_URL = getattr(settings, "DATABASE_ASYNC_URL", None) or _make_asyn
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,               # Match sync engine pool_size for consistency
-    max_overflow=5,             # Match sync engine max_overflow
-    pool_timeout=10,            # Match sync engine pool_timeout
-    pool_recycle=3600,          # Match sync engine pool_recycle
-    echo=False,                 # Set to True for SQL debugging
+    pool_size=settings.DB_POOL_SIZE,          # Match sync engine pool_size for consistency
+    max_overflow=settings.DB_MAX_OVERFLOW,    # Match sync engine max_overflow
+    pool_timeout=settings.DB_POOL_TIMEOUT,    # Match sync engine pool_timeout
+    pool_recycle=settings.DB_POOL_RECYCLE,    # Match sync engine pool_recycle
+    echo=settings.DB_ECHO_ENABLED,            # Set DB_ECHO_ENABLED=true for SQL debugging
     connect_args={
-        "statement_cache_size": 20,      # Enable statement caching
-        "prepared_statement_cache_size": 10,  # Enable prepared statements
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,              # Enable statement caching
+        "prepared_statement_cache_size": settings.DB_PREPARED_STMT_CACHE_SIZE,  # Enable prepared statements
         "command_timeout": 60,
         "server_settings": {
             "jit": "off",
@@ -170,9 +169,9 @@ logger.info(
     "Async database engine configured (for FastAPI endpoints)",
     extra={"extra_data": {
         "pool_type": "AsyncQueuePool",
-        "pool_size": 10,
-        "max_overflow": 5,
-        "pool_timeout": 10,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
         "context": "FastAPI only - use get_async_db() dependency"
     }}
 )
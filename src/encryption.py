@@ -1,6 +1,8 @@
 import json
 from functools import lru_cache
 
+import orjson
+
 from cryptography.fernet import Fernet, InvalidToken
 from sqlalchemy import Text
 from sqlalchemy.types import TypeDecorator
@@ -47,6 +49,9 @@ class EncryptedJSON(TypeDecorator):
     Serialises the Python object to a JSON string, encrypts it, then stores the
     result as TEXT. On read, decrypts and deserialises back to a Python object.
     Falls back to plain JSON parsing for rows written before encryption was enabled.
+
+    Uses orjson, which works on bytes directly (no str round trip before
+    encrypting) and is much faster than json on large values like chat metadata.
     """
     impl = Text
     cache_ok = True
@@ -54,16 +59,26 @@ class EncryptedJSON(TypeDecorator):
     def process_bind_param(self, value, _dialect):
         if value is None:
             return None
-        return _get_fernet().encrypt(json.dumps(value).encode()).decode()
+        return _get_fernet().encrypt(
+            orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        ).decode()
 
     def process_result_value(self, value, _dialect):
         if value is None:
             return None
         try:
-            return json.loads(_get_fernet().decrypt(value.encode()).decode())
+            return _loads(_get_fernet().decrypt(value.encode()))
         except InvalidToken:
             # Pre-encryption row — value is a plain JSON string.
             try:
-                return json.loads(value)
+                return _loads(value)
             except (json.JSONDecodeError, ValueError):
                 return value
+
+
+def _loads(data):
+    """orjson.loads, falling back to json for NaN/Infinity written by json.dumps."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
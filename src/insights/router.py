@@ -10,17 +10,17 @@ Endpoints:
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select
 from typing import Annotated
-from uuid import UUID
 
 from ..database import get_async_db
 from ..auth.dependencies import get_current_user_id
 from ..credits.service import CreditService
 from ..rag.generation_service import InsightGenerationOrchestrator
 from ..rag import schemas as rag_schemas
-from ..rag.models import Insight, AnalysisCategory, InsightGenerationJob
+from ..rag.models import Insight, InsightType, InsightGenerationJob
 from ..chats.models import Chat
+from ..chats.dependencies import get_owned_chat
 from ..credits import schemas as credit_schemas
 from ..logging_config import get_logger
 from ..config import settings
@@ -172,7 +172,7 @@ async def get_generation_job_status(
 
 @router.get("/chats/{chat_id}", response_model=rag_schemas.ChatInsightsResponse)
 async def get_chat_insights(
-    chat_id: UUID,
+    chat: Annotated[Chat, Depends(get_owned_chat)],
     user_id: Annotated[str, Depends(get_current_user_id)],
     db: AsyncSession = Depends(get_async_db)
 ):
@@ -188,36 +188,20 @@ async def get_chat_insights(
     - 404: Chat not found
     - 403: Access denied
     """
+    chat_id = chat.id
+
     logger.debug(
         f"Getting insights for chat {chat_id}",
         extra={"user_id": user_id}
     )
     
     try:
-        # Verify chat belongs to user
-        result = await db.execute(
-            select(Chat).where(
-                and_(
-                    Chat.id == chat_id,
-                    Chat.user_id == user_id,
-                    Chat.is_deleted == False
-                )
-            )
-        )
-        chat = result.scalar_one_or_none()
-        
-        if not chat:
+        # Ownership is checked by get_owned_chat; deleted chats stay hidden
+        if chat.is_deleted:
             raise NotFoundException("Chat", str(chat_id))
         
-        # Get category info if insights unlocked
-        category = None
-        if chat.category_id:
-            result = await db.execute(
-                select(AnalysisCategory).where(
-                    AnalysisCategory.id == chat.category_id
-                )
-            )
-            category = result.scalar_one_or_none()
+        # Category is joined-loaded with the chat
+        category = chat.category
         
         # Get all insights
         result = await db.execute(
@@ -255,8 +239,6 @@ async def create_insight_response_async(
 ) -> rag_schemas.InsightResponse:
     """Create insight response (async variant)"""
     # Get insight type details
-    from ..rag.models import InsightType
-    
     result = await db.execute(
         select(InsightType).where(InsightType.id == insight.insight_type_id)
     )
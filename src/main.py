@@ -2,7 +2,7 @@
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import time
 import asyncio
@@ -231,6 +231,8 @@ app = FastAPI(
     description="WhatsApp Chat Analysis & Insights Platform",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes response models (UUID/datetime included) natively and much faster than stdlib json
+    default_response_class=ORJSONResponse,
     # Disable default exception handlers - we'll use custom ones
     exception_handlers={}
 )
@@ -7,12 +7,14 @@ and performance tracking.
 import time
 import uuid
 from typing import Callable
-from fastapi import Request, Response
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
 from .logging_config import get_logger
 from .config import settings
+from .error_handlers import ErrorCode, format_error_response
 
 logger = get_logger(__name__)
 
@@ -175,6 +177,50 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class UploadSizeLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Reject oversized uploads with 413 from the Content-Length header,
+    before the multipart body is read and spooled.
+
+    The endpoint's file.size check stays as the fallback for chunked
+    requests that carry no Content-Length.
+    """
+    
+    UPLOAD_PATHS = ("/api/chats/upload",)
+    # Content-Length covers the whole multipart body (boundaries, form fields)
+    MULTIPART_OVERHEAD_BYTES = 64 * 1024
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if request.method == "POST" and request.url.path in self.UPLOAD_PATHS:
+            content_length = request.headers.get("content-length")
+            limit = settings.MAX_UPLOAD_SIZE_BYTES + self.MULTIPART_OVERHEAD_BYTES
+            
+            if content_length and content_length.isdigit() and int(content_length) > limit:
+                request_id = getattr(request.state, "request_id", None)
+                logger.warning(
+                    f"Upload rejected by Content-Length: {content_length} bytes",
+                    extra={
+                        "request_id": request_id,
+                        "extra_data": {
+                            "path": request.url.path,
+                            "content_length": int(content_length),
+                            "max_size_bytes": settings.MAX_UPLOAD_SIZE_BYTES
+                        }
+                    }
+                )
+                return JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content=format_error_response(
+                        error_code=ErrorCode.FILE_TOO_LARGE,
+                        message=f"File too large. Maximum size is {settings.MAX_UPLOAD_SIZE_MB} MB.",
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        request_id=request_id
+                    )
+                )
+        
+        return await call_next(request)
+
+
 def register_middleware(app):
     """
     Register all middleware with FastAPI app
@@ -189,4 +235,7 @@ def register_middleware(app):
     # User context extraction
     app.add_middleware(UserContextMiddleware)
     
+    # Upload size guard (413 before the body is read)
+    app.add_middleware(UploadSizeLimitMiddleware)
+    
     logger.info("Middleware registered successfully")
\ No newline at end of file
@@ -177,7 +177,12 @@ class AIConversation(Base):
     # Relationships
     chat = relationship("Chat", back_populates="ai_conversations")
     user = relationship("User", back_populates="ai_conversations")
-    messages = relationship("AIMessage", back_populates="conversation", cascade="all, delete-orphan")
+    messages = relationship(
+        "AIMessage",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="AIMessage.created_at"  # Chronological order comes from SQL, no Python-side sort
+    )
 
 
 class AIMessage(Base):
@@ -190,4 +195,8 @@ class AIMessage(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    conversation = relationship("AIConversation", back_populates="messages")
\ No newline at end of file
+    conversation = relationship("AIConversation", back_populates="messages")
+
+    __table_args__ = (
+        Index('ix_ai_messages_conversation_id_created_at', 'conversation_id', 'created_at'),
+    )
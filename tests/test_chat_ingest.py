@@ -0,0 +1,83 @@
+"""
+Message ingest: the CSV rendered for COPY ... FROM STDIN (FORMAT csv)
+
+PostgreSQL reads an unquoted empty field as NULL and splits rows on
+unquoted newlines, so every row must be one physical line and only a
+missing sender may be empty.
+"""
+
+import csv
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from src.chats import service
+from src.encryption import EncryptedText
+
+TRICKY_CONTENTS = [
+    "tab\there",
+    "line one\nline two\r\nline three",
+    "back\\slash \\N \\. and \\\\",
+    'quotes "inside", commas, and \'single\'',
+    "nul\x00byte",
+    "",
+    "emoji 🙏🏼 and हिंदी",
+]
+
+
+def _render(senders, contents):
+    chat_id = uuid4()
+    ids = service._random_uuid_hexes(len(contents))
+    timestamps = [
+        datetime(2023, 1, 1, 8, i, tzinfo=timezone.utc) for i in range(len(contents))
+    ]
+    buf = service._build_copy_buffer(chat_id, ids, senders, contents, timestamps)
+    return chat_id, ids, timestamps, buf.getvalue()
+
+
+def test_copy_buffer_round_trips_tricky_text():
+    senders = ["Alice", None, "Bob\tTab", "Carol\nNewline", "Dev\\", "", "Eve"]
+    chat_id, ids, timestamps, rendered = _render(senders, TRICKY_CONTENTS)
+    decrypt = EncryptedText().process_result_value
+
+    rows = list(csv.reader(rendered.splitlines()))
+    assert len(rows) == len(TRICKY_CONTENTS)
+
+    for row, message_id, sender, content, timestamp in zip(rows, ids, senders, TRICKY_CONTENTS, timestamps):
+        assert len(row) == 5
+        assert UUID(row[0]).hex == message_id
+        assert row[1] == str(chat_id)
+        # Stored encrypted, exactly as EncryptedText writes on the ORM path
+        assert row[3] != content
+        assert decrypt(row[3], None) == content
+        if sender is None:
+            assert row[2] == ""
+        else:
+            assert row[2] != sender
+            assert decrypt(row[2], None) == sender
+        assert datetime.fromisoformat(row[4]) == timestamp
+
+
+def test_copy_buffer_rows_are_single_unquoted_lines():
+    # Ciphertext is URL-safe base64, so nothing needs quoting or escaping and
+    # the only empty field is the NULL sender
+    senders = [None] + ["Alice"] * (len(TRICKY_CONTENTS) - 1)
+    _, _, _, rendered = _render(senders, TRICKY_CONTENTS)
+
+    lines = rendered.split("\r\n")
+    assert lines.pop() == ""
+    assert len(lines) == len(TRICKY_CONTENTS)
+    for line in lines:
+        assert '"' not in line and "\n" not in line and "\t" not in line
+        fields = line.split(",")
+        assert len(fields) == 5
+        assert all(fields[i] for i in (0, 1, 3, 4))
+    assert lines[0].split(",")[2] == ""
+
+
+def test_random_uuid_hexes_are_version_4():
+    hexes = service._random_uuid_hexes(100)
+    assert len(set(hexes)) == 100
+    for value in hexes:
+        parsed = UUID(value)
+        assert parsed.version == 4
+        assert parsed.hex == value
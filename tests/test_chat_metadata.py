@@ -0,0 +1,53 @@
+"""
+Chat metadata must not drift from the original per-message implementation
+
+chat_metadata_golden.json was produced by compute_chat_metadata as it was
+before the pandas/numpy rewrite (whatstk's WhatsAppChat.from_source on the
+same fixture files), with the English NLTK stopwords unavailable.
+"""
+
+import json
+
+import pytest
+
+from src.chats import service
+
+FIXTURE_CHATS = ["chat_group.txt", "chat_pair.txt"]
+
+
+@pytest.fixture
+def golden(fixtures_dir):
+    return json.loads((fixtures_dir / "chat_metadata_golden.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(autouse=True)
+def without_nltk_stopwords(monkeypatch):
+    # The golden output was made without the NLTK corpus; pin the same set
+    monkeypatch.setattr(
+        service,
+        "STOPWORDS",
+        frozenset(service.CONFIG['HINDI_STOPWORDS']).union(service.CONFIG['WHATSAPP_NOISE_WORDS'])
+    )
+
+
+@pytest.mark.parametrize("filename", FIXTURE_CHATS)
+def test_metadata_matches_golden(fixtures_dir, golden, filename):
+    text = (fixtures_dir / filename).read_text(encoding="utf-8")
+    chat = service.whatsapp_chat_from_text(text)
+    participants = chat.df['username'].dropna().unique().tolist()
+
+    metadata = service.compute_chat_metadata(chat, participants)
+
+    # Round trip through JSON as EncryptedJSON stores it
+    assert json.loads(json.dumps(metadata, default=str)) == golden[filename]
+
+
+@pytest.mark.parametrize("filename", FIXTURE_CHATS)
+def test_parse_whatsapp_file_matches_golden(fixtures_dir, golden, filename):
+    with open(fixtures_dir / filename, "rb") as source:
+        chat, participants, title, metadata = service.parse_whatsapp_file(source, filename, is_zip=False)
+
+    assert len(chat.df) == golden[filename]["total_messages"]
+    assert title
+    assert sorted(participants) == sorted(golden[filename]["user_stats"])
+    assert json.loads(json.dumps(metadata, default=str)) == golden[filename]
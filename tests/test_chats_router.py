@@ -0,0 +1,268 @@
+"""
+Chats endpoints: the 202 upload / status-polling contract and chat listing
+
+Runs the real router and processing code against an in-memory chat store;
+only the database round trips (session, chat lookups, message rows) are
+replaced.
+"""
+
+import asyncio
+import io
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+# src.database first: it imports every model module (as src.main does)
+from src.database import get_async_db
+from src.auth.dependencies import get_current_user_id
+from src.chats import models, router as chats_router, service
+from src.chats.dependencies import get_owned_chat
+from src.error_handlers import ErrorCode, NotFoundException, register_exception_handlers
+from src.rate_limit import limiter
+
+USER_ID = "user_test"
+
+
+class FakeSyncSession:
+    """Stands in for SessionLocal() in the background parse"""
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def delete(self, synchronize_session=None):
+        return 0
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeAsyncSession:
+    """Records the statements run by list_user_chats"""
+
+    def __init__(self, store):
+        self.store = store
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        chats = sorted(self.store.values(), key=lambda chat: chat.created_at, reverse=True)
+        return FakeResult(chats)
+
+
+def _new_chat(user_id, filename, category_id=None, file_sha256=None, status="processing"):
+    chat = models.Chat(
+        id=uuid4(),
+        user_id=user_id,
+        title=filename,
+        category_id=category_id,
+        file_sha256=file_sha256,
+        status=status,
+        platform="whatsapp",
+        message_count=0,
+        vector_status="pending",
+        chunk_count=0,
+        insights_generation_status="not_started",
+        created_at=datetime.now(timezone.utc),
+    )
+    chat.insights_unlocked = False
+    return chat
+
+
+@pytest.fixture
+def store():
+    return {}
+
+
+@pytest.fixture
+def upload_sem(monkeypatch):
+    sem = asyncio.Semaphore(1)
+    monkeypatch.setattr(chats_router, "UPLOAD_SEM", sem)
+    return sem
+
+
+@pytest.fixture
+def db(store):
+    return FakeAsyncSession(store)
+
+
+@pytest.fixture
+def client(monkeypatch, store, upload_sem, db):
+    duplicates = {}
+
+    async def get_chat_by_upload_hash(db, user_id, file_sha256, category_id=None):
+        return duplicates.get(file_sha256)
+
+    async def create_chat(db, user_id, filename, category_id=None, file_sha256=None):
+        chat = _new_chat(user_id, filename, category_id, file_sha256)
+        store[chat.id] = chat
+        return chat
+
+    def save_messages_to_db(db, chat_id, whatstk_chat):
+        return len(whatstk_chat.df)
+
+    monkeypatch.setattr(service, "get_chat_by_upload_hash", get_chat_by_upload_hash)
+    monkeypatch.setattr(service, "create_chat", create_chat)
+    monkeypatch.setattr(service, "_get_chat_by_id_sync", lambda db, chat_id: store.get(chat_id))
+    monkeypatch.setattr(service, "save_messages_to_db", save_messages_to_db)
+    monkeypatch.setattr(chats_router, "SessionLocal", FakeSyncSession)
+    monkeypatch.setattr(limiter, "enabled", False)
+
+    async def owned_chat(chat_id: UUID):
+        if chat_id not in store:
+            raise NotFoundException("Chat")
+        return store[chat_id]
+
+    async def async_db():
+        yield db
+
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.include_router(chats_router.router, prefix="/api")
+    app.dependency_overrides[get_current_user_id] = lambda: USER_ID
+    app.dependency_overrides[get_owned_chat] = owned_chat
+    app.dependency_overrides[get_async_db] = async_db
+
+    with TestClient(app) as test_client:
+        test_client.duplicates = duplicates
+        yield test_client
+
+
+def _upload(client, content, filename="chat.txt", content_type="text/plain"):
+    return client.post(
+        "/api/chats/upload",
+        files={"file": (filename, content, content_type)},
+        headers={"Authorization": "Bearer test"},
+    )
+
+
+# ============================================================================
+# UPLOAD
+# ============================================================================
+
+def test_upload_returns_202_then_completes(client, fixtures_dir, upload_sem):
+    content = (fixtures_dir / "chat_pair.txt").read_bytes()
+
+    response = _upload(client, content)
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "processing"
+    assert body["chat_metadata"] is None
+
+    # TestClient runs background tasks before returning, so this is the
+    # state a polling client sees once the parse has finished
+    polled = client.get(f"/api/chats/{body['chat_id']}").json()
+    assert polled["status"] == "completed"
+    assert polled["error_log"] is None
+    assert polled["message_count"] == polled["chat_metadata"]["total_messages"] > 0
+    assert sorted(polled["participants"]) == ["Alice", "Bob"]
+    assert not upload_sem.locked()
+
+
+def test_upload_that_fails_to_parse_is_marked_failed(client, upload_sem):
+    response = _upload(client, b"this is not a whatsapp export\n")
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "processing"
+
+    polled = client.get(f"/api/chats/{response.json()['chat_id']}").json()
+    assert polled["status"] == "failed"
+    assert polled["error_log"]
+    assert polled["chat_metadata"] is None
+    assert not upload_sem.locked()
+
+    # Failed chats stay listed until deleted
+    listed = client.get("/api/chats").json()
+    assert [chat["status"] for chat in listed] == ["failed"]
+
+
+def test_duplicate_upload_returns_existing_chat(client, fixtures_dir, store, upload_sem):
+    content = (fixtures_dir / "chat_pair.txt").read_bytes()
+    existing = _new_chat(USER_ID, "chat.txt", status="processing")
+    client.duplicates[service.compute_upload_sha256(io.BytesIO(content))] = existing
+
+    response = _upload(client, content)
+
+    assert response.status_code == 200
+    assert response.json()["chat_id"] == str(existing.id)
+    assert response.json()["status"] == "processing"
+    assert store == {}  # No new chat, no parse queued
+    assert not upload_sem.locked()
+
+
+def test_upload_rejected_with_503_when_all_slots_busy(client, monkeypatch, store):
+    monkeypatch.setattr(chats_router, "UPLOAD_SEM", asyncio.Semaphore(0))
+
+    response = _upload(client, b"1/1/23, 10:00 - Alice: hi\n")
+
+    assert response.status_code == 503
+    assert response.json()["error"]["code"] == ErrorCode.RATE_LIMIT_EXCEEDED
+    assert store == {}
+
+
+def test_upload_rejects_invalid_type_before_taking_a_slot(client, store, upload_sem):
+    response = _upload(client, b"%PDF-1.4", filename="chat.pdf", content_type="application/pdf")
+
+    assert response.status_code == 400
+    assert store == {}
+    assert not upload_sem.locked()
+
+
+# ============================================================================
+# LIST
+# ============================================================================
+
+def _compiled(stmt):
+    return stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+
+def test_list_returns_every_chat_by_default(client, db, store):
+    for status in ("completed", "processing", "failed"):
+        chat = _new_chat(USER_ID, f"{status}.txt", status=status)
+        store[chat.id] = chat
+
+    response = client.get("/api/chats")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    sql = str(_compiled(db.statements[-1]))
+    assert "LIMIT ALL OFFSET 0" in sql  # No row cap
+    assert "ORDER BY chats.created_at DESC" in sql
+
+
+def test_list_pages_with_limit_and_offset(client, db):
+    response = client.get("/api/chats", params={"limit": 20, "offset": 40})
+
+    assert response.status_code == 200
+    sql = str(_compiled(db.statements[-1]))
+    assert "LIMIT 20" in sql
+    assert "OFFSET 40" in sql
+
+
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 101}, {"offset": -1}])
+def test_list_rejects_out_of_range_paging(client, params):
+    assert client.get("/api/chats", params=params).status_code == 422